@@ -25,6 +25,7 @@ Risk Levels:
 """
 
 from typing import Optional, Tuple, List, Dict, Any
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
@@ -116,6 +117,7 @@ class HybridMoneyManager:
     DEFAULT_MAX_STAKE_PCT = 0.20  # Max 20% of balance per trade
     DEFAULT_DAILY_LOSS_LIMIT = 0.30  # 30% of starting balance
     DEFAULT_PROFIT_TARGET = 0.10  # 10% daily target
+    MAX_HISTORY = 10_000  # Batas trade/stake history, entry tertua dibuang otomatis
     
     def __init__(
         self,
@@ -158,8 +160,8 @@ class HybridMoneyManager:
         )
         
         # History
-        self.trade_history: List[Dict[str, Any]] = []
-        self.stake_history: List[float] = []
+        self.trade_history: deque[Dict[str, Any]] = deque(maxlen=self.MAX_HISTORY)
+        self.stake_history: deque[float] = deque(maxlen=self.MAX_HISTORY)
         
         # Calculate limits
         self._update_limits()
@@ -2444,6 +2444,14 @@ def shutdown_handler(signum, frame):
         
         result = trading_manager.stop()
         logger.info(f"Trading manager stopped: {result}")
+        
+        # Row journal dan snapshot session recovery yang masih antri harus
+        # tertulis sebelum sys.exit; stop() tidak flush jika contract masih pending
+        trading_manager.flush_pending_writes()
+        
+        # Kirim notifikasi trade/session yang masih antri sebelum exit
+        if not trading_manager.flush_notifications(timeout=10.0):
+            logger.warning("⚠️ Timeout flushing pending notifications")
     
     if deriv_ws:
         try:
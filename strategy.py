@@ -47,12 +47,14 @@ Enhancement v4.0 - Multi-Horizon Prediction System:
 =============================================================
 """
 
-from typing import List, Optional, Tuple, Any, Dict
+from typing import List, Optional, Tuple, Any, Dict, Iterable
+from array import array
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
 from datetime import datetime
 import logging
 import math
+import time
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -152,6 +154,32 @@ class Signal(Enum):
     WAIT = "WAIT"
 
 
+class TrendQuality(IntEnum):
+    """Kualitas trend dari _calculate_price_velocity (ordered, bisa dibandingkan >=)"""
+    WEAK = 0
+    MODERATE = 1
+    STRONG = 2
+    
+    def __str__(self) -> str:
+        return self.name
+
+
+class BBPosition(IntEnum):
+    """Posisi harga relatif terhadap Bollinger Bands (ordered dari bawah ke atas)"""
+    BELOW_LOWER = 0
+    NEAR_LOWER = 1
+    MIDDLE = 2
+    NEAR_UPPER = 3
+    ABOVE_UPPER = 4
+    
+    def __str__(self) -> str:
+        return self.name
+
+
+# Bobot velocity per TrendQuality (index = nilai enum)
+_VELOCITY_QUALITY_STRENGTH = (0.4, 0.6, 0.8)
+
+
 @dataclass
 class IndicatorValues:
     """Container untuk semua nilai indikator"""
@@ -201,6 +229,28 @@ class AnalysisResult:
     tick_picker: Optional[TickPickerData] = None
 
 
+class _LazyFactors:
+    """Accumulator faktor prediksi yang menunda formatting string.
+    
+    Faktor disimpan sebagai (fmt, args) dan hanya di-format saat render()
+    dipanggil (di dalam guard logger.isEnabledFor), sehingga tick yang tidak
+    di-log tidak membayar biaya str.format.
+    """
+    __slots__ = ('items',)
+    
+    def __init__(self):
+        self.items: List[Tuple[str, tuple]] = []
+    
+    def add(self, fmt: str, *args: Any) -> None:
+        self.items.append((fmt, args))
+    
+    def render(self, n: int) -> str:
+        return ', '.join(fmt.format(*args) for fmt, args in self.items[:n])
+    
+    def __len__(self) -> int:
+        return len(self.items)
+
+
 class TradingStrategy:
     """
     Kelas utama untuk strategi trading dengan multi-indicator confirmation.
@@ -376,9 +426,12 @@ class TradingStrategy:
     
     def __init__(self):
         """Inisialisasi strategy dengan tick history kosong"""
-        self.tick_history: List[float] = []
-        self.high_history: List[float] = []
-        self.low_history: List[float] = []
+        # Price buffers disimpan sebagai array('d') - double kontigu (8 byte/elemen)
+        # alih-alih list of float objects. float32 tidak dipakai karena harga
+        # synthetic (mis. 1000.12345) butuh lebih dari 7 digit presisi.
+        self.tick_history: 'array[float]' = array('d')
+        self.high_history: 'array[float]' = array('d')
+        self.low_history: 'array[float]' = array('d')
         self.rsi_history: List[float] = []
         self.ema_fast_history: List[float] = []
         self.volume_history: List[float] = []
@@ -397,10 +450,44 @@ class TradingStrategy:
         self._macd_signal_cache: Optional[float] = None
         self._macd_values_cache: List[float] = []
         self._last_tick_count_for_ema: int = 0
+        # total_tick_count saat last_indicators terakhir dihitung
+        self._indicators_tick: int = -1
         
         # Regime Detection v4.2 - Track previous regime for change logging
         self._previous_regime: Optional[str] = None
         
+        # Per-tick memo untuk get_volatility_zone() dan check_ema_trend(),
+        # keyed on total_tick_count sehingga tiap tick hanya dihitung sekali
+        self._vol_zone_cache: Optional[Tuple[str, float]] = None
+        self._vol_zone_cache_tick: int = -1
+        self._ema_trend_cache: Optional[str] = None
+        self._ema_trend_cache_tick: int = -1
+        
+        self._cache_prediction_weights()
+        
+    def _cache_prediction_weights(self) -> None:
+        """Cache bobot PREDICTION_WEIGHTED_FACTORS sebagai attribute.
+        
+        predict_tick_direction() membaca bobot ini setiap tick; menyimpannya
+        sebagai attribute menghindari dict lookup berulang. Panggil ulang
+        jika PREDICTION_WEIGHTED_FACTORS diubah saat runtime.
+        """
+        weights = self.PREDICTION_WEIGHTED_FACTORS
+        self._w_momentum = weights.get('momentum', 0.20)
+        self._w_sequence = weights.get('sequence', 0.15)
+        self._w_ema_slope = weights.get('ema_slope', 0.12)
+        self._w_macd = weights.get('macd', 0.12)
+        self._w_stoch = weights.get('stoch', 0.08)
+        self._w_adx = weights.get('adx', 0.08)
+        self._w_roc = weights.get('roc', 0.08)
+        self._w_velocity = weights.get('velocity', 0.07)
+        self._w_hh_ll = weights.get('hh_ll', 0.05)
+        self._w_bollinger = weights.get('bollinger', 0.05)
+        self._total_weight_full = (
+            self._w_momentum + self._w_sequence + self._w_ema_slope + self._w_macd + self._w_stoch
+            + self._w_adx + self._w_roc + self._w_velocity + self._w_hh_ll + self._w_bollinger
+        )
+        
     def add_tick(self, price: float) -> None:
         """
         Tambahkan tick baru ke history.
@@ -411,9 +498,6 @@ class TradingStrategy:
         - Periodic memory cleanup
         - Memory usage logging
         """
-        import time
-        import sys
-        
         if not is_valid_number(price):
             logger.warning(f"Invalid tick price received: {price}, skipping")
             return
@@ -423,38 +507,112 @@ class TradingStrategy:
             logger.warning(f"Non-positive tick price: {price}, skipping")
             return
         
-        self.tick_history.append(price)
-        self.total_tick_count += 1
-        
-        if len(self.tick_history) > 1:
-            prev_price = self.tick_history[-2]
-            high = max(price, prev_price)
-            low = min(price, prev_price)
-        else:
-            high = price
-            low = price
+        ticks = self.tick_history
+        if ticks:
+            prev_price = ticks[-1]
+            if price > prev_price:
+                high, low = price, prev_price
+            else:
+                high, low = prev_price, price
             
+            volume_history = self.volume_history
+            volume_history.append(abs(price - prev_price))
+            if len(volume_history) > self.VOLUME_HISTORY_SIZE:
+                del volume_history[0]
+        else:
+            high = low = price
+        
+        ticks.append(price)
         self.high_history.append(high)
         self.low_history.append(low)
+        self.total_tick_count += 1
         
-        if len(self.tick_history) > 1:
-            estimated_volume = abs(price - self.tick_history[-2])
-            self.volume_history.append(estimated_volume)
-            if len(self.volume_history) > self.VOLUME_HISTORY_SIZE:
-                self.volume_history = self.volume_history[-self.VOLUME_HISTORY_SIZE:]
-        
-        if len(self.tick_history) > self.MAX_TICK_HISTORY:
-            self.tick_history = self.tick_history[-self.MAX_TICK_HISTORY:]
-            self.high_history = self.high_history[-self.MAX_TICK_HISTORY:]
-            self.low_history = self.low_history[-self.MAX_TICK_HISTORY:]
+        if len(ticks) > self.MAX_TICK_HISTORY:
+            del ticks[0]
+            del self.high_history[0]
+            del self.low_history[0]
         
+        # Cleanup + log memory hanya di kelipatan MEMORY_CLEANUP_INTERVAL,
+        # time.time() tidak perlu dipanggil di tick lain
         if self.total_tick_count % self.MEMORY_CLEANUP_INTERVAL == 0:
             self._perform_memory_cleanup()
+            
+            current_time = time.time()
+            if current_time - self._last_memory_log_time >= 30:
+                self._log_memory_usage()
+                self._last_memory_log_time = current_time
+    
+    def add_ticks(self, prices: Iterable[float]) -> int:
+        """
+        Tambahkan banyak tick sekaligus (preload history).
+        
+        Hasil akhirnya sama dengan memanggil add_tick() untuk setiap harga
+        secara berurutan: batch dipotong di setiap kelipatan
+        MEMORY_CLEANUP_INTERVAL supaya memory cleanup tetap jalan di tick
+        yang sama.
+        
+        Args:
+            prices: Harga tick, urut dari yang terlama
+        
+        Returns:
+            Jumlah tick valid yang ditambahkan
+        """
+        valid_prices: List[float] = []
+        for price in prices:
+            if not is_valid_number(price):
+                logger.warning(f"Invalid tick price received: {price}, skipping")
+                continue
+            price = safe_float(price, 0.0)
+            if price <= 0:
+                logger.warning(f"Non-positive tick price: {price}, skipping")
+                continue
+            valid_prices.append(price)
+        
+        interval = self.MEMORY_CLEANUP_INTERVAL
+        start = 0
+        while start < len(valid_prices):
+            end = start + interval - self.total_tick_count % interval
+            self._extend_history(valid_prices[start:end])
+            start = end
+            
+            if self.total_tick_count % interval == 0:
+                self._perform_memory_cleanup()
+                
+                current_time = time.time()
+                if current_time - self._last_memory_log_time >= 30:
+                    self._log_memory_usage()
+                    self._last_memory_log_time = current_time
+        
+        return len(valid_prices)
+    
+    def _extend_history(self, prices: List[float]) -> None:
+        """Append harga yang sudah divalidasi ke semua history (bagian batch add_ticks)"""
+        if not prices:
+            return
         
-        current_time = time.time()
-        if self.total_tick_count % self.MEMORY_CLEANUP_INTERVAL == 0 and current_time - self._last_memory_log_time >= 30:
-            self._log_memory_usage()
-            self._last_memory_log_time = current_time
+        ticks = self.tick_history
+        had_history = len(ticks) > 0
+        # Harga sebelumnya untuk tiap tick; tick pertama tanpa history
+        # dipasangkan dengan dirinya sendiri (high = low = price)
+        prev_prices = [ticks[-1] if had_history else prices[0]]
+        prev_prices.extend(prices[:-1])
+        
+        ticks.extend(prices)
+        self.high_history.extend(map(max, prices, prev_prices))
+        self.low_history.extend(map(min, prices, prev_prices))
+        self.total_tick_count += len(prices)
+        
+        volumes = [abs(price - prev) for price, prev in zip(prices, prev_prices)]
+        if not had_history:
+            del volumes[0]
+        self.volume_history.extend(volumes)
+        if len(self.volume_history) > self.VOLUME_HISTORY_SIZE:
+            del self.volume_history[:-self.VOLUME_HISTORY_SIZE]
+        
+        if len(ticks) > self.MAX_TICK_HISTORY:
+            del ticks[:-self.MAX_TICK_HISTORY]
+            del self.high_history[:-self.MAX_TICK_HISTORY]
+            del self.low_history[:-self.MAX_TICK_HISTORY]
     
     def _perform_memory_cleanup(self) -> None:
         """
@@ -495,9 +653,9 @@ class TradingStrategy:
             
     def clear_history(self) -> None:
         """Reset semua history dan EMA cache"""
-        self.tick_history.clear()
-        self.high_history.clear()
-        self.low_history.clear()
+        del self.tick_history[:]
+        del self.high_history[:]
+        del self.low_history[:]
         self.rsi_history.clear()
         self.ema_fast_history.clear()
         self.volume_history.clear()
@@ -514,8 +672,14 @@ class TradingStrategy:
         self._macd_signal_cache = None
         self._macd_values_cache.clear()
         self._last_tick_count_for_ema = 0
+        self._indicators_tick = -1
         self._previous_regime = None
         
+        self._vol_zone_cache = None
+        self._vol_zone_cache_tick = -1
+        self._ema_trend_cache = None
+        self._ema_trend_cache_tick = -1
+        
     def calculate_ema(self, prices: List[float], period: int) -> float:
         """
         Calculate Exponential Moving Average.
@@ -1408,7 +1572,20 @@ class TradingStrategy:
             - NORMAL (0.1-1.0%): 1.0x - Normal trading conditions for synthetics
             - HIGH (1.0-2.5%): 0.85x - High volatility, reduced size
             - EXTREME_HIGH (> 2.5%): 0.7x - Extreme volatility, reduced size
+            
+        Result di-memo per tick (invalidated saat tick baru masuk atau
+        last_indicators di-refresh oleh calculate_all_indicators).
         """
+        if self._vol_zone_cache_tick == self.total_tick_count and self._vol_zone_cache is not None:
+            return self._vol_zone_cache
+        
+        zone = self._compute_volatility_zone()
+        self._vol_zone_cache = zone
+        self._vol_zone_cache_tick = self.total_tick_count
+        return zone
+    
+    def _compute_volatility_zone(self) -> Tuple[str, float]:
+        """Hitung volatility zone tanpa memo (lihat get_volatility_zone)"""
         if not self.tick_history or len(self.tick_history) < self.ATR_PERIOD + 1:
             return "UNKNOWN", 1.0
         
@@ -1436,6 +1613,9 @@ class TradingStrategy:
     def check_rsi_momentum(self, current_rsi: float, signal_type: str) -> Tuple[bool, float]:
         """Check RSI momentum direction.
         
+        Read-only: rsi_history diisi sekali per tick oleh calculate_all_indicators(),
+        jadi hasilnya tidak bergantung pada berapa kali/urutan gate memanggil fungsi ini.
+        
         Args:
             current_rsi: Current RSI value
             signal_type: "BUY" or "SELL"
@@ -1445,15 +1625,11 @@ class TradingStrategy:
             - is_favorable: True if RSI is moving in the right direction
             - momentum_bonus: Score bonus (0.0 to 0.10)
         """
-        self.rsi_history.append(current_rsi)
-        if len(self.rsi_history) > self.RSI_HISTORY_SIZE:
-            self.rsi_history = self.rsi_history[-self.RSI_HISTORY_SIZE:]
-        
-        if len(self.rsi_history) < 3:
+        rsi_history = self.rsi_history
+        if len(rsi_history) < 3:
             return False, 0.0
         
-        recent_rsi = self.rsi_history[-3:]
-        rsi_change = recent_rsi[-1] - recent_rsi[0]
+        rsi_change = rsi_history[-1] - rsi_history[-3]
         
         if signal_type == "BUY":
             if rsi_change < 0 and current_rsi < 40:
@@ -1556,7 +1732,19 @@ class TradingStrategy:
         """
         Check EMA crossover trend.
         Returns: "BULLISH", "BEARISH", or "NEUTRAL"
+        
+        Result di-memo per tick karena hanya bergantung pada tick_history.
         """
+        if self._ema_trend_cache_tick == self.total_tick_count and self._ema_trend_cache is not None:
+            return self._ema_trend_cache
+        
+        trend = self._compute_ema_trend()
+        self._ema_trend_cache = trend
+        self._ema_trend_cache_tick = self.total_tick_count
+        return trend
+    
+    def _compute_ema_trend(self) -> str:
+        """Hitung EMA crossover trend tanpa memo (lihat check_ema_trend)"""
         if len(self.tick_history) < self.EMA_SLOW_PERIOD:
             return "NEUTRAL"
             
@@ -2106,19 +2294,19 @@ class TradingStrategy:
         Returns:
             ROC value (positive = bullish, negative = bearish)
         """
-        if len(self.tick_history) < period + 1:
+        ticks = self.tick_history
+        if len(ticks) < period + 1:
             return 0.0
         
-        current_price = safe_float(self.tick_history[-1])
-        past_price = safe_float(self.tick_history[-period - 1])
-        
+        # tick_history hanya berisi harga valid (dicek di add_tick),
+        # jadi cukup satu pengurangan dan satu pembagian
+        past_price = ticks[-period - 1]
         if past_price <= 0:
             return 0.0
         
-        roc = safe_divide((current_price - past_price) * 100, past_price, 0.0)
-        return round(roc, 4)
+        return round((ticks[-1] - past_price) * 100 / past_price, 4)
     
-    def _calculate_price_velocity(self, periods: Optional[List[int]] = None) -> Tuple[float, float, str]:
+    def _calculate_price_velocity(self, periods: Optional[List[int]] = None) -> Tuple[float, float, TrendQuality]:
         """
         Calculate price velocity and acceleration across multiple timeframes.
         
@@ -2129,42 +2317,43 @@ class TradingStrategy:
             Tuple of (average_velocity, acceleration, trend_quality)
             - average_velocity: Average rate of price change
             - acceleration: Change in velocity (positive = accelerating up)
-            - trend_quality: "STRONG", "MODERATE", "WEAK"
+            - trend_quality: TrendQuality.STRONG, MODERATE, or WEAK
         """
         if periods is None:
             periods = self.PREDICTION_PRICE_VELOCITY_PERIODS
         
+        ticks = self.tick_history
+        n = len(ticks)
         min_period = max(periods) if periods else 8
-        if len(self.tick_history) < min_period + 2:
-            return 0.0, 0.0, "WEAK"
-        
-        velocities = []
-        for period in periods:
-            if len(self.tick_history) >= period + 1:
-                start_price = safe_float(self.tick_history[-period - 1])
-                end_price = safe_float(self.tick_history[-1])
-                if start_price > 0:
-                    velocity = safe_divide((end_price - start_price), period, 0.0)
-                    velocities.append(velocity)
+        if n < min_period + 2:
+            return 0.0, 0.0, TrendQuality.WEAK
+        
+        # Semua velocity diukur ke harga terakhir yang sama; baca sekali saja
+        end_price = ticks[-1]
+        velocities = [
+            (end_price - ticks[-period - 1]) / period
+            for period in periods
+            if period > 0 and n >= period + 1 and ticks[-period - 1] > 0
+        ]
         
         if not velocities:
-            return 0.0, 0.0, "WEAK"
+            return 0.0, 0.0, TrendQuality.WEAK
         
-        avg_velocity = safe_divide(sum(velocities), len(velocities), 0.0)
+        avg_velocity = sum(velocities) / len(velocities)
         
         acceleration = 0.0
         if len(velocities) >= 2:
             acceleration = velocities[-1] - velocities[0]
         
-        all_same_direction = all(v > 0 for v in velocities) or all(v < 0 for v in velocities)
+        all_same_direction = min(velocities) > 0 or max(velocities) < 0
         velocity_magnitude = abs(avg_velocity)
         
         if all_same_direction and velocity_magnitude > 0.5:
-            trend_quality = "STRONG"
+            trend_quality = TrendQuality.STRONG
         elif all_same_direction or velocity_magnitude > 0.2:
-            trend_quality = "MODERATE"
+            trend_quality = TrendQuality.MODERATE
         else:
-            trend_quality = "WEAK"
+            trend_quality = TrendQuality.WEAK
         
         return round(avg_velocity, 6), round(acceleration, 6), trend_quality
     
@@ -2231,7 +2420,7 @@ class TradingStrategy:
         
         return pattern, strength, round(confidence, 2)
     
-    def _calculate_bollinger_position(self, period: int = 20, std_mult: float = 2.0) -> Tuple[str, float]:
+    def _calculate_bollinger_position(self, period: int = 20, std_mult: float = 2.0) -> Tuple[BBPosition, float]:
         """
         Calculate current price position relative to Bollinger Bands.
         
@@ -2241,11 +2430,11 @@ class TradingStrategy:
             
         Returns:
             Tuple of (position, strength)
-            - position: "ABOVE_UPPER", "NEAR_UPPER", "MIDDLE", "NEAR_LOWER", "BELOW_LOWER"
+            - position: BBPosition (ABOVE_UPPER, NEAR_UPPER, MIDDLE, NEAR_LOWER, BELOW_LOWER)
             - strength: 0.0 to 1.0 (how far from middle band)
         """
         if len(self.tick_history) < period:
-            return "MIDDLE", 0.0
+            return BBPosition.MIDDLE, 0.0
         
         recent = self.tick_history[-period:]
         current_price = safe_float(self.tick_history[-1])
@@ -2260,24 +2449,24 @@ class TradingStrategy:
         
         band_width = upper_band - lower_band
         if band_width <= 0:
-            return "MIDDLE", 0.0
+            return BBPosition.MIDDLE, 0.0
         
         position_pct = safe_divide((current_price - lower_band), band_width, 0.5)
         
         if position_pct >= 1.0:
-            position = "ABOVE_UPPER"
+            position = BBPosition.ABOVE_UPPER
             strength = min(1.0, position_pct - 1.0 + 0.5)
         elif position_pct >= 0.85:
-            position = "NEAR_UPPER"
+            position = BBPosition.NEAR_UPPER
             strength = (position_pct - 0.5) * 2
         elif position_pct <= 0.0:
-            position = "BELOW_LOWER"
+            position = BBPosition.BELOW_LOWER
             strength = min(1.0, abs(position_pct) + 0.5)
         elif position_pct <= 0.15:
-            position = "NEAR_LOWER"
+            position = BBPosition.NEAR_LOWER
             strength = (0.5 - position_pct) * 2
         else:
-            position = "MIDDLE"
+            position = BBPosition.MIDDLE
             strength = abs(0.5 - position_pct) * 2
         
         return position, round(min(1.0, strength), 2)
@@ -2703,18 +2892,26 @@ class TradingStrategy:
             - direction: "UP" or "DOWN"
             - confidence: 0.0 to 1.0
         """
-        if len(self.tick_history) < self.MIN_TICK_HISTORY:
+        ticks = self.tick_history
+        n_ticks = len(ticks)
+        if n_ticks < self.MIN_TICK_HISTORY:
             return "UP", 0.0
         
+        # Hoist konstanta class yang dipakai berulang ke local (LOAD_FAST)
+        adx_strong_trend = self.ADX_STRONG_TREND
+        
         mh_direction, mh_confidence, mh_details = self.predict_tick_direction_multi_horizon()
+        mh_agreement = mh_details.get('agreement_level', 0)
+        mh_usable = mh_direction != "NEUTRAL" and mh_agreement >= self.MULTI_HORIZON_MIN_AGREEMENT
         
-        if mh_direction != "NEUTRAL" and mh_details.get('agreement_level', 0) >= self.MULTI_HORIZON_MIN_AGREEMENT:
-            logger.debug(
-                f"🎯 Using Multi-Horizon prediction: {mh_direction} (conf={mh_confidence:.2f}, "
-                f"agreement={mh_details.get('agreement_level')}/3)"
-            )
+        if mh_usable:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "🎯 Using Multi-Horizon prediction: %s (conf=%.2f, agreement=%s/3)",
+                    mh_direction, mh_confidence, mh_agreement
+                )
             
-            if mh_details.get('agreement_level') == 3:
+            if mh_agreement == 3:
                 return mh_direction, mh_confidence
         
         indicators = self.last_indicators
@@ -2723,16 +2920,14 @@ class TradingStrategy:
         
         up_score = 0.0
         down_score = 0.0
-        total_weight = 0.0
-        prediction_factors = []
-        weights = self.PREDICTION_WEIGHTED_FACTORS
+        total_weight = self._total_weight_full
+        prediction_factors = _LazyFactors()
         
-        momentum_weight = weights.get('momentum', 0.20)
-        total_weight += momentum_weight
+        momentum_weight = self._w_momentum
         
-        lookback = min(self.PREDICTION_MOMENTUM_LOOKBACK, len(self.tick_history) - 1)
+        lookback = min(self.PREDICTION_MOMENTUM_LOOKBACK, n_ticks - 1)
         if lookback >= 3:
-            recent_ticks = self.tick_history[-lookback:]
+            recent_ticks = ticks[-lookback:]
             price_changes = [recent_ticks[i] - recent_ticks[i-1] for i in range(1, len(recent_ticks))]
             
             if len(price_changes) >= 2:
@@ -2741,42 +2936,41 @@ class TradingStrategy:
                 second_third = price_changes[third_len:2*third_len]
                 last_third = price_changes[2*third_len:]
                 
-                first_avg = safe_divide(sum(first_third), len(first_third), 0.0)
-                second_avg = safe_divide(sum(second_third), len(second_third), 0.0) if second_third else first_avg
-                last_avg = safe_divide(sum(last_third), len(last_third), 0.0) if last_third else second_avg
+                first_avg = sum(first_third) / len(first_third)
+                second_avg = sum(second_third) / len(second_third) if second_third else first_avg
+                last_avg = sum(last_third) / len(last_third) if last_third else second_avg
                 
                 accel_1 = second_avg - first_avg
                 accel_2 = last_avg - second_avg
                 total_accel = accel_1 + accel_2
                 
-                avg_change = safe_divide(sum(abs(c) for c in price_changes), len(price_changes), 0.001)
-                normalized_accel = safe_divide(total_accel, avg_change, 0.0)
+                avg_change = sum(abs(c) for c in price_changes) / len(price_changes)
+                normalized_accel = total_accel / avg_change if avg_change != 0 else 0.0
                 
                 recent_bias = sum(price_changes[-5:]) if len(price_changes) >= 5 else sum(price_changes)
                 
                 if normalized_accel > 0.2 or (normalized_accel > 0 and recent_bias > 0):
                     strength = min(1.0, abs(normalized_accel) * 0.8 + 0.2)
                     up_score += momentum_weight * strength
-                    prediction_factors.append(f"🚀 Momentum UP ({normalized_accel:.2f})")
+                    prediction_factors.add("🚀 Momentum UP ({:.2f})", normalized_accel)
                 elif normalized_accel < -0.2 or (normalized_accel < 0 and recent_bias < 0):
                     strength = min(1.0, abs(normalized_accel) * 0.8 + 0.2)
                     down_score += momentum_weight * strength
-                    prediction_factors.append(f"📉 Momentum DOWN ({normalized_accel:.2f})")
+                    prediction_factors.add("📉 Momentum DOWN ({:.2f})", normalized_accel)
                 else:
                     net_change = sum(price_changes)
                     if net_change > 0:
                         up_score += momentum_weight * 0.4
-                        prediction_factors.append(f"Net UP")
+                        prediction_factors.add("Net UP")
                     elif net_change < 0:
                         down_score += momentum_weight * 0.4
-                        prediction_factors.append(f"Net DOWN")
+                        prediction_factors.add("Net DOWN")
         
-        sequence_weight = weights.get('sequence', 0.15)
-        total_weight += sequence_weight
+        sequence_weight = self._w_sequence
         
-        seq_lookback = min(self.PREDICTION_SEQUENCE_LOOKBACK, len(self.tick_history) - 1)
+        seq_lookback = min(self.PREDICTION_SEQUENCE_LOOKBACK, n_ticks - 1)
         if seq_lookback >= 3:
-            recent = self.tick_history[-seq_lookback:]
+            recent = ticks[-seq_lookback:]
             consecutive_up = 0
             consecutive_down = 0
             
@@ -2800,23 +2994,24 @@ class TradingStrategy:
             if consecutive_up >= 3:
                 strength = min(1.0, consecutive_up / 4)
                 up_score += sequence_weight * strength
-                prediction_factors.append(f"⬆️ Consec UP ({consecutive_up})")
+                prediction_factors.add("⬆️ Consec UP ({})", consecutive_up)
             elif consecutive_down >= 3:
                 strength = min(1.0, consecutive_down / 4)
                 down_score += sequence_weight * strength
-                prediction_factors.append(f"⬇️ Consec DOWN ({consecutive_down})")
+                prediction_factors.add("⬇️ Consec DOWN ({})", consecutive_down)
             elif up_ticks > down_ticks + 2:
                 up_score += sequence_weight * 0.6
-                prediction_factors.append(f"Pattern UP ({up_ticks}/{down_ticks})")
+                prediction_factors.add("Pattern UP ({}/{})", up_ticks, down_ticks)
             elif down_ticks > up_ticks + 2:
                 down_score += sequence_weight * 0.6
-                prediction_factors.append(f"Pattern DOWN ({down_ticks}/{up_ticks})")
+                prediction_factors.add("Pattern DOWN ({}/{})", down_ticks, up_ticks)
         
-        ema_weight = weights.get('ema_slope', 0.12)
-        total_weight += ema_weight
+        ema_weight = self._w_ema_slope
         
-        if indicators.ema_fast > 0 and indicators.ema_slow > 0:
-            ema_diff_pct = safe_divide((indicators.ema_fast - indicators.ema_slow) * 100, indicators.ema_slow, 0.0)
+        ema_fast = indicators.ema_fast
+        ema_slow = indicators.ema_slow
+        if ema_fast > 0 and ema_slow > 0:
+            ema_diff_pct = (ema_fast - ema_slow) * 100 / ema_slow
             
             slope_valid, _, slope_data = self.check_ema_slope("BUY")
             slope_direction = slope_data.get('direction', 'flat')
@@ -2824,17 +3019,16 @@ class TradingStrategy:
             
             strength_mult = 1.0 if slope_strength == 'strong' else 0.7 if slope_strength == 'moderate' else 0.4
             
-            if indicators.ema_fast > indicators.ema_slow:
+            if ema_fast > ema_slow:
                 if slope_direction in ['bullish', 'flat']:
                     up_score += ema_weight * strength_mult
-                    prediction_factors.append(f"EMA bullish")
-            elif indicators.ema_fast < indicators.ema_slow:
+                    prediction_factors.add("EMA bullish")
+            elif ema_fast < ema_slow:
                 if slope_direction in ['bearish', 'flat']:
                     down_score += ema_weight * strength_mult
-                    prediction_factors.append(f"EMA bearish")
+                    prediction_factors.add("EMA bearish")
         
-        macd_weight = weights.get('macd', 0.12)
-        total_weight += macd_weight
+        macd_weight = self._w_macd
         
         if indicators.macd_histogram != 0:
             macd_hist = indicators.macd_histogram
@@ -2852,19 +3046,18 @@ class TradingStrategy:
                 if histogram_increasing:
                     strength = min(1.0, strength + 0.2)
                 up_score += macd_weight * strength
-                prediction_factors.append(f"MACD+")
+                prediction_factors.add("MACD+")
             else:
                 strength = min(1.0, abs(macd_hist) * 800 + 0.3)
                 down_score += macd_weight * strength
-                prediction_factors.append(f"MACD-")
+                prediction_factors.add("MACD-")
             
             if macd_line > macd_signal and histogram_positive:
                 up_score += macd_weight * 0.15
             elif macd_line < macd_signal and not histogram_positive:
                 down_score += macd_weight * 0.15
         
-        stoch_weight = weights.get('stoch', 0.08)
-        total_weight += stoch_weight
+        stoch_weight = self._w_stoch
         
         stoch_k = indicators.stoch_k
         stoch_d = indicators.stoch_d
@@ -2872,7 +3065,7 @@ class TradingStrategy:
         if stoch_k > stoch_d:
             if stoch_k < 25:
                 up_score += stoch_weight * 1.0
-                prediction_factors.append(f"Stoch OS cross ({stoch_k:.0f})")
+                prediction_factors.add("Stoch OS cross ({:.0f})", stoch_k)
             elif stoch_k < 50:
                 up_score += stoch_weight * 0.7
             else:
@@ -2880,87 +3073,83 @@ class TradingStrategy:
         elif stoch_k < stoch_d:
             if stoch_k > 75:
                 down_score += stoch_weight * 1.0
-                prediction_factors.append(f"Stoch OB cross ({stoch_k:.0f})")
+                prediction_factors.add("Stoch OB cross ({:.0f})", stoch_k)
             elif stoch_k > 50:
                 down_score += stoch_weight * 0.7
             else:
                 down_score += stoch_weight * 0.4
         
-        adx_weight = weights.get('adx', 0.08)
-        total_weight += adx_weight
+        adx_weight = self._w_adx
         
         adx = indicators.adx
         plus_di = indicators.plus_di
         minus_di = indicators.minus_di
         
-        if adx >= self.ADX_STRONG_TREND:
+        if adx >= adx_strong_trend:
             trend_strength = min(1.0, adx / 35)
             if plus_di > minus_di:
                 up_score += adx_weight * trend_strength
-                prediction_factors.append(f"ADX bullish ({adx:.0f})")
+                prediction_factors.add("ADX bullish ({:.0f})", adx)
             elif minus_di > plus_di:
                 down_score += adx_weight * trend_strength
-                prediction_factors.append(f"ADX bearish ({adx:.0f})")
+                prediction_factors.add("ADX bearish ({:.0f})", adx)
         elif adx >= self.ADX_WEAK_TREND:
             if plus_di > minus_di + 5:
                 up_score += adx_weight * 0.5
             elif minus_di > plus_di + 5:
                 down_score += adx_weight * 0.5
         
-        roc_weight = weights.get('roc', 0.08)
-        total_weight += roc_weight
+        roc_weight = self._w_roc
         
         roc = self._calculate_rate_of_change(self.PREDICTION_ROC_LOOKBACK)
         if roc > 0.02:
             strength = min(1.0, abs(roc) * 10 + 0.3)
             up_score += roc_weight * strength
-            prediction_factors.append(f"ROC+ ({roc:.3f})")
+            prediction_factors.add("ROC+ ({:.3f})", roc)
         elif roc < -0.02:
             strength = min(1.0, abs(roc) * 10 + 0.3)
             down_score += roc_weight * strength
-            prediction_factors.append(f"ROC- ({roc:.3f})")
+            prediction_factors.add("ROC- ({:.3f})", roc)
         
-        velocity_weight = weights.get('velocity', 0.07)
-        total_weight += velocity_weight
+        velocity_weight = self._w_velocity
         
         avg_velocity, acceleration, trend_quality = self._calculate_price_velocity()
-        if avg_velocity > 0 and (acceleration > 0 or trend_quality in ["STRONG", "MODERATE"]):
-            strength = 0.8 if trend_quality == "STRONG" else 0.6 if trend_quality == "MODERATE" else 0.4
+        trending = trend_quality >= TrendQuality.MODERATE
+        if avg_velocity > 0 and (acceleration > 0 or trending):
+            strength = _VELOCITY_QUALITY_STRENGTH[trend_quality]
             up_score += velocity_weight * strength
-            prediction_factors.append(f"Vel+ ({trend_quality[:3]})")
-        elif avg_velocity < 0 and (acceleration < 0 or trend_quality in ["STRONG", "MODERATE"]):
-            strength = 0.8 if trend_quality == "STRONG" else 0.6 if trend_quality == "MODERATE" else 0.4
+            prediction_factors.add("Vel+ ({!s:.3})", trend_quality)
+        elif avg_velocity < 0 and (acceleration < 0 or trending):
+            strength = _VELOCITY_QUALITY_STRENGTH[trend_quality]
             down_score += velocity_weight * strength
-            prediction_factors.append(f"Vel- ({trend_quality[:3]})")
+            prediction_factors.add("Vel- ({!s:.3})", trend_quality)
         
-        hh_ll_weight = weights.get('hh_ll', 0.05)
-        total_weight += hh_ll_weight
+        hh_ll_weight = self._w_hh_ll
         
         pattern, strength, pattern_conf = self._detect_higher_highs_lower_lows(self.PREDICTION_HIGHER_HIGHS_LOOKBACK)
         if pattern == "HH" and pattern_conf > 0.3:
             up_score += hh_ll_weight * pattern_conf
-            prediction_factors.append(f"HH ({strength})")
+            prediction_factors.add("HH ({})", strength)
         elif pattern == "LL" and pattern_conf > 0.3:
             down_score += hh_ll_weight * pattern_conf
-            prediction_factors.append(f"LL ({strength})")
+            prediction_factors.add("LL ({})", strength)
         
-        bb_weight = weights.get('bollinger', 0.05)
-        total_weight += bb_weight
+        bb_weight = self._w_bollinger
         
         bb_position, bb_strength = self._calculate_bollinger_position(
             self.PREDICTION_BOLLINGER_PERIOD, self.PREDICTION_BOLLINGER_STD
         )
         
-        if bb_position in ["BELOW_LOWER", "NEAR_LOWER"]:
+        if bb_position <= BBPosition.NEAR_LOWER:
             up_score += bb_weight * bb_strength
-            prediction_factors.append(f"BB oversold")
-        elif bb_position in ["ABOVE_UPPER", "NEAR_UPPER"]:
+            prediction_factors.add("BB oversold")
+        elif bb_position >= BBPosition.NEAR_UPPER:
             down_score += bb_weight * bb_strength
-            prediction_factors.append(f"BB overbought")
+            prediction_factors.add("BB overbought")
         
         if total_weight > 0:
-            up_normalized = safe_divide(up_score, total_weight, 0.0)
-            down_normalized = safe_divide(down_score, total_weight, 0.0)
+            up_normalized = up_score / total_weight
+            down_normalized = down_score / total_weight
         else:
             up_normalized = 0.0
             down_normalized = 0.0
@@ -2980,7 +3169,7 @@ class TradingStrategy:
         
         confidence = min(1.0, raw_confidence * (1 + score_diff * 0.6))
         
-        if adx >= self.ADX_STRONG_TREND:
+        if adx >= adx_strong_trend:
             confidence = min(1.0, confidence * 1.18)
         elif adx < self.ADX_NO_TREND:
             confidence = confidence * 0.82
@@ -2993,30 +3182,34 @@ class TradingStrategy:
         
         confidence = max(0.0, min(1.0, confidence))
         
-        if mh_direction != "NEUTRAL" and mh_details.get('agreement_level', 0) >= self.MULTI_HORIZON_MIN_AGREEMENT:
+        if mh_usable:
             if mh_direction == direction:
                 confidence = min(1.0, (confidence + mh_confidence) / 2 + 0.05)
-                logger.info(
-                    f"🎯 Prediction v4: {direction} (conf={confidence:.1%}) | "
-                    f"MH={mh_direction}({mh_details.get('agreement_level')}/3) + Detailed AGREE | "
-                    f"Factors: {', '.join(prediction_factors[:4])}"
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "🎯 Prediction v4: %s (conf=%.1f%%) | MH=%s(%s/3) + Detailed AGREE | Factors: %s",
+                        direction, confidence * 100, mh_direction, mh_agreement,
+                        prediction_factors.render(4)
+                    )
             else:
                 direction = mh_direction
                 confidence = mh_confidence * 0.9
-                logger.info(
-                    f"🎯 Prediction v4: {direction} (conf={confidence:.1%}) | "
-                    f"MH={mh_direction}({mh_details.get('agreement_level')}/3) OVERRIDE detailed | "
-                    f"Detailed was: {('UP' if up_normalized > down_normalized else 'DOWN')}"
-                )
-        else:
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "🎯 Prediction v4: %s (conf=%.1f%%) | MH=%s(%s/3) OVERRIDE detailed | Detailed was: %s",
+                        direction, confidence * 100, mh_direction, mh_agreement,
+                        'UP' if up_normalized > down_normalized else 'DOWN'
+                    )
+        elif logger.isEnabledFor(logging.INFO):
             logger.info(
-                f"🎯 Prediction v4: {direction} (conf={confidence:.1%}) | "
-                f"Detailed analysis (MH={mh_direction}) | "
-                f"UP={up_normalized:.2f} DOWN={down_normalized:.2f} | "
-                f"Factors: {', '.join(prediction_factors[:4])}"
+                "🎯 Prediction v4: %s (conf=%.1f%%) | Detailed analysis (MH=%s) | "
+                "UP=%.2f DOWN=%.2f | Factors: %s",
+                direction, confidence * 100, mh_direction,
+                up_normalized, down_normalized, prediction_factors.render(4)
             )
         
+        # Tetap di-round 3 desimal: _finalize_signal membandingkan nilai ini dengan
+        # MIN_PREDICTION_CONFIDENCE, dan path multi-horizon juga mengembalikan round(..., 3)
         return direction, round(confidence, 3)
         
     def calculate_all_indicators(self) -> IndicatorValues:
@@ -3026,7 +3219,13 @@ class TradingStrategy:
         Enhancement v2.4:
         - Uses incremental EMA calculation for O(1) per tick complexity
         - Caches EMA values to avoid O(n²) recalculation
+        - Returns last_indicators langsung jika tick ini sudah dihitung
+          (analyze/predict/memory cleanup bisa memanggil berulang per tick,
+          dan update EMA incremental tidak boleh diterapkan dua kali)
         """
+        if self._indicators_tick == self.total_tick_count:
+            return self.last_indicators
+        
         indicators = IndicatorValues()
         
         if len(self.tick_history) < self.RSI_PERIOD:
@@ -3034,6 +3233,12 @@ class TradingStrategy:
             
         indicators.rsi = self.calculate_rsi(self.tick_history, self.RSI_PERIOD)
         
+        # RSI history untuk check_rsi_momentum(): satu entry per tick yang dihitung
+        rsi_history = self.rsi_history
+        rsi_history.append(indicators.rsi)
+        if len(rsi_history) > self.RSI_HISTORY_SIZE:
+            del rsi_history[0]
+        
         if len(self.tick_history) >= self.EMA_SLOW_PERIOD:
             indicators.ema_fast = self.calculate_ema_incremental(self.EMA_FAST_PERIOD, "fast")
             indicators.ema_slow = self.calculate_ema_incremental(self.EMA_SLOW_PERIOD, "slow")
@@ -3071,6 +3276,9 @@ class TradingStrategy:
         self._last_tick_count_for_ema = len(self.tick_history)
         
         self.last_indicators = indicators
+        self._indicators_tick = self.total_tick_count
+        # ATR baru -> volatility zone memo harus dihitung ulang
+        self._vol_zone_cache_tick = -1
         return indicators
         
     def analyze(self) -> AnalysisResult:
@@ -3103,14 +3311,18 @@ class TradingStrategy:
         
         min_required = max(self.RSI_PERIOD + 1, self.EMA_SLOW_PERIOD, self.ADX_PERIOD + 1)
         if len(self.tick_history) < min_required:
-            logger.info(f"⏳ Collecting data: {len(self.tick_history)}/{min_required} ticks")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("⏳ Collecting data: %d/%d ticks", len(self.tick_history), min_required)
             return result
             
         indicators = self.calculate_all_indicators()
+        rsi = indicators.rsi
+        adx = indicators.adx
+        min_confidence = self.MIN_CONFIDENCE_THRESHOLD
         result.indicators = indicators
-        result.rsi_value = indicators.rsi
+        result.rsi_value = rsi
         result.trend_direction = indicators.trend_direction
-        result.adx_value = indicators.adx
+        result.adx_value = adx
         
         vol_zone, vol_multiplier = self.get_volatility_zone()
         result.volatility_zone = vol_zone
@@ -3134,61 +3346,66 @@ class TradingStrategy:
         buy_reasons = []
         sell_reasons = []
         
-        if indicators.rsi < self.RSI_OVERSOLD:
+        if rsi < self.RSI_OVERSOLD:
             buy_score += 0.35
-            buy_reasons.append(f"RSI Oversold ({indicators.rsi:.1f})")
+            buy_reasons.append(f"RSI Oversold ({rsi:.1f})")
             
-            rsi_valid, rsi_reason = self.check_rsi_entry_range(indicators.rsi, "BUY")
+            rsi_valid, rsi_reason = self.check_rsi_entry_range(rsi, "BUY")
             if rsi_valid:
                 buy_score += 0.05
                 buy_reasons.append(rsi_reason)
-        elif indicators.rsi > self.RSI_OVERBOUGHT:
+        elif rsi > self.RSI_OVERBOUGHT:
             sell_score += 0.35
-            sell_reasons.append(f"RSI Overbought ({indicators.rsi:.1f})")
+            sell_reasons.append(f"RSI Overbought ({rsi:.1f})")
             
-            rsi_valid, rsi_reason = self.check_rsi_entry_range(indicators.rsi, "SELL")
+            rsi_valid, rsi_reason = self.check_rsi_entry_range(rsi, "SELL")
             if rsi_valid:
                 sell_score += 0.05
                 sell_reasons.append(rsi_reason)
-        elif self.RSI_BUY_ENTRY_MIN <= indicators.rsi <= self.RSI_BUY_ENTRY_MAX:
+        elif self.RSI_BUY_ENTRY_MIN <= rsi <= self.RSI_BUY_ENTRY_MAX:
             buy_score += 0.25
-            buy_reasons.append(f"RSI in BUY zone ({indicators.rsi:.1f})")
-        elif self.RSI_SELL_ENTRY_MIN <= indicators.rsi <= self.RSI_SELL_ENTRY_MAX:
+            buy_reasons.append(f"RSI in BUY zone ({rsi:.1f})")
+        elif self.RSI_SELL_ENTRY_MIN <= rsi <= self.RSI_SELL_ENTRY_MAX:
             sell_score += 0.25
-            sell_reasons.append(f"RSI in SELL zone ({indicators.rsi:.1f})")
+            sell_reasons.append(f"RSI in SELL zone ({rsi:.1f})")
             
-        if indicators.ema_fast > 0 and indicators.ema_slow > 0:
-            current_price = safe_float(self.tick_history[-1])
+        ema_fast = indicators.ema_fast
+        ema_slow = indicators.ema_slow
+        macd_histogram = indicators.macd_histogram
+        stoch_k = indicators.stoch_k
+        
+        if ema_fast > 0 and ema_slow > 0:
+            current_price = self.tick_history[-1]
             
-            if indicators.ema_fast > indicators.ema_slow:
+            if ema_fast > ema_slow:
                 buy_score += 0.20
                 buy_reasons.append("EMA9 > EMA21 (Bullish)")
                 
-                if current_price > indicators.ema_fast and current_price > indicators.ema_slow:
+                if current_price > ema_fast and current_price > ema_slow:
                     buy_score += 0.05
                     buy_reasons.append("Price above both EMAs")
-            elif indicators.ema_fast < indicators.ema_slow:
+            elif ema_fast < ema_slow:
                 sell_score += 0.20
                 sell_reasons.append("EMA9 < EMA21 (Bearish)")
                 
-                if current_price < indicators.ema_fast and current_price < indicators.ema_slow:
+                if current_price < ema_fast and current_price < ema_slow:
                     sell_score += 0.05
                     sell_reasons.append("Price below both EMAs")
                 
-        if indicators.macd_histogram != 0:
-            if indicators.macd_histogram > 0:
+        if macd_histogram != 0:
+            if macd_histogram > 0:
                 buy_score += 0.15
                 buy_reasons.append("MACD Positive")
             else:
                 sell_score += 0.15
                 sell_reasons.append("MACD Negative")
                 
-        if indicators.stoch_k < self.STOCH_OVERSOLD:
+        if stoch_k < self.STOCH_OVERSOLD:
             buy_score += 0.10
-            buy_reasons.append(f"Stoch Oversold ({indicators.stoch_k:.1f})")
-        elif indicators.stoch_k > self.STOCH_OVERBOUGHT:
+            buy_reasons.append(f"Stoch Oversold ({stoch_k:.1f})")
+        elif stoch_k > self.STOCH_OVERBOUGHT:
             sell_score += 0.10
-            sell_reasons.append(f"Stoch Overbought ({indicators.stoch_k:.1f})")
+            sell_reasons.append(f"Stoch Overbought ({stoch_k:.1f})")
             
         if indicators.trend_direction == "UP":
             buy_score += 0.05
@@ -3197,189 +3414,171 @@ class TradingStrategy:
             sell_score += 0.05
             sell_reasons.append("Trend Down")
         
-        if indicators.adx >= self.ADX_STRONG_TREND:
+        if adx >= self.ADX_STRONG_TREND:
             if buy_score > sell_score:
                 buy_score += 0.15
-                buy_reasons.append(f"ADX Strong ({indicators.adx:.1f})")
+                buy_reasons.append(f"ADX Strong ({adx:.1f})")
             elif sell_score > buy_score:
                 sell_score += 0.15
-                sell_reasons.append(f"ADX Strong ({indicators.adx:.1f})")
+                sell_reasons.append(f"ADX Strong ({adx:.1f})")
         
         if buy_score > sell_score:
-            rsi_momentum, momentum_bonus = self.check_rsi_momentum(indicators.rsi, "BUY")
+            rsi_momentum, momentum_bonus = self.check_rsi_momentum(rsi, "BUY")
             if momentum_bonus > 0:
                 buy_score += momentum_bonus
                 buy_reasons.append(f"RSI Momentum +{momentum_bonus:.2f}")
         elif sell_score > buy_score:
-            rsi_momentum, momentum_bonus = self.check_rsi_momentum(indicators.rsi, "SELL")
+            rsi_momentum, momentum_bonus = self.check_rsi_momentum(rsi, "SELL")
             if momentum_bonus > 0:
                 sell_score += momentum_bonus
                 sell_reasons.append(f"RSI Momentum +{momentum_bonus:.2f}")
         
-        adx_tp_multiplier = 1.0
-        
         # Regime detection for smarter entries
-        is_trending = indicators.adx >= self.ADX_STRONG_TREND
-        is_ranging = indicators.adx < self.ADX_NO_TREND
-        
-        if buy_score >= self.MIN_CONFIDENCE_THRESHOLD and buy_score > sell_score:
-            cooldown_ok, cooldown_reason = self.should_generate_signal("BUY")
-            if not cooldown_ok:
-                result.signal = Signal.WAIT
-                result.confidence = 0.0
-                result.reason = cooldown_reason
-                logger.debug(f"⏳ BUY blocked by cooldown: {cooldown_reason}")
-                return result
-            
-            pred_direction, pred_confidence = self.predict_tick_direction(look_ahead=5)
-            
-            if pred_direction != "UP":
-                result.signal = Signal.WAIT
-                result.confidence = 0.0
-                result.reason = f"🎯 Prediction conflict: BUY signal but predicted {pred_direction} (conf={pred_confidence:.2f})"
-                logger.info(f"🚫 BUY blocked by prediction: {pred_direction} vs UP required (conf={pred_confidence:.2f})")
-                return result
-            
-            if pred_confidence < self.MIN_PREDICTION_CONFIDENCE:
-                result.signal = Signal.WAIT
-                result.confidence = 0.0
-                result.reason = f"🎯 Low prediction confidence: {pred_confidence:.2f} < {self.MIN_PREDICTION_CONFIDENCE} for BUY"
-                logger.info(f"🚫 BUY blocked by low prediction confidence: {pred_confidence:.2f} < {self.MIN_PREDICTION_CONFIDENCE}")
-                return result
-            
-            adx_valid, adx_reason, adx_tp_multiplier = self.check_adx_filter(
-                indicators.adx, indicators.plus_di, indicators.minus_di, "BUY"
-            )
-            
-            if not adx_valid and indicators.adx >= self.ADX_NO_TREND:
-                buy_reasons.append(adx_reason)
-            elif adx_valid:
-                buy_reasons.append(adx_reason)
-            
-            confluence_score, confidence_level, confluence_details = self.get_confluence_score(
-                "BUY", indicators
+        is_trending = adx >= self.ADX_STRONG_TREND
+        is_ranging = adx < self.ADX_NO_TREND
+        
+        if buy_score >= min_confidence and buy_score > sell_score:
+            final_result = self._finalize_signal(
+                result, Signal.BUY, buy_score, buy_reasons, indicators, vol_zone, vol_multiplier
             )
-            
-            if confluence_score < self.MIN_CONFLUENCE_SCORE and confidence_level == "WEAK":
-                result.signal = Signal.WAIT
-                result.confidence = 0.0
-                result.reason = f"Confluence too weak ({confluence_score:.0f}/100) | Failed: {confluence_details.get('filters_failed', [])}"
-                logger.debug(f"⏳ BUY blocked by weak confluence: {confluence_score:.0f}/100")
-                return result
-            
-            confluence_multiplier = 1.0
-            if confidence_level == "STRONG":
-                confluence_multiplier = 1.15
-            elif confidence_level == "MEDIUM":
-                confluence_multiplier = 1.0
-            else:
-                confluence_multiplier = 0.85
-            
-            # Regime-aware score adjustment v4.3
-            regime_multiplier, regime_reason = self.get_regime_score_adjustment("BUY", indicators)
-            buy_reasons.append(regime_reason)
-            
-            if adx_valid or indicators.adx == 0:
-                self.update_signal_time("BUY")
+            if final_result is not None:
+                return final_result
                 
-                result.signal = Signal.BUY
-                final_confidence = min(buy_score * vol_multiplier * adx_tp_multiplier * confluence_multiplier * regime_multiplier, 1.0)
-                result.confidence = final_confidence
-                result.reason = " | ".join(buy_reasons)
-                
-                result.reason += f" | Confluence: {confluence_score:.0f}/100 ({confidence_level})"
-                result.reason += f" | 🎯Pred: {pred_direction} ({pred_confidence:.0%})"
-                
-                if vol_multiplier < 1.0:
-                    result.reason += f" | Vol Zone: {vol_zone} ({vol_multiplier:.0%})"
-                
-                logger.info(f"🟢 BUY Signal: score={buy_score:.2f}, confluence={confluence_score:.0f}/100, regime={regime_multiplier:.2f}, final_conf={final_confidence:.2f}, ADX={indicators.adx:.1f}, Pred={pred_direction}({pred_confidence:.0%})")
-                return result
-                
-        if sell_score >= self.MIN_CONFIDENCE_THRESHOLD and sell_score > buy_score:
-            cooldown_ok, cooldown_reason = self.should_generate_signal("SELL")
-            if not cooldown_ok:
-                result.signal = Signal.WAIT
-                result.confidence = 0.0
-                result.reason = cooldown_reason
-                logger.debug(f"⏳ SELL blocked by cooldown: {cooldown_reason}")
-                return result
-            
-            pred_direction, pred_confidence = self.predict_tick_direction(look_ahead=5)
-            
-            if pred_direction != "DOWN":
-                result.signal = Signal.WAIT
-                result.confidence = 0.0
-                result.reason = f"🎯 Prediction conflict: SELL signal but predicted {pred_direction} (conf={pred_confidence:.2f})"
-                logger.info(f"🚫 SELL blocked by prediction: {pred_direction} vs DOWN required (conf={pred_confidence:.2f})")
-                return result
-            
-            if pred_confidence < self.MIN_PREDICTION_CONFIDENCE:
-                result.signal = Signal.WAIT
-                result.confidence = 0.0
-                result.reason = f"🎯 Low prediction confidence: {pred_confidence:.2f} < {self.MIN_PREDICTION_CONFIDENCE} for SELL"
-                logger.info(f"🚫 SELL blocked by low prediction confidence: {pred_confidence:.2f} < {self.MIN_PREDICTION_CONFIDENCE}")
-                return result
-            
-            adx_valid, adx_reason, adx_tp_multiplier = self.check_adx_filter(
-                indicators.adx, indicators.plus_di, indicators.minus_di, "SELL"
+        if sell_score >= min_confidence and sell_score > buy_score:
+            final_result = self._finalize_signal(
+                result, Signal.SELL, sell_score, sell_reasons, indicators, vol_zone, vol_multiplier
             )
-            
-            if not adx_valid and indicators.adx >= self.ADX_NO_TREND:
-                sell_reasons.append(adx_reason)
-            elif adx_valid:
-                sell_reasons.append(adx_reason)
-            
-            confluence_score, confidence_level, confluence_details = self.get_confluence_score(
-                "SELL", indicators
-            )
-            
-            if confluence_score < self.MIN_CONFLUENCE_SCORE and confidence_level == "WEAK":
-                result.signal = Signal.WAIT
-                result.confidence = 0.0
-                result.reason = f"Confluence too weak ({confluence_score:.0f}/100) | Failed: {confluence_details.get('filters_failed', [])}"
-                logger.debug(f"⏳ SELL blocked by weak confluence: {confluence_score:.0f}/100")
-                return result
-            
-            confluence_multiplier = 1.0
-            if confidence_level == "STRONG":
-                confluence_multiplier = 1.15
-            elif confidence_level == "MEDIUM":
-                confluence_multiplier = 1.0
-            else:
-                confluence_multiplier = 0.85
-            
-            # Regime-aware score adjustment v4.3
-            regime_multiplier, regime_reason = self.get_regime_score_adjustment("SELL", indicators)
-            sell_reasons.append(regime_reason)
-            
-            if adx_valid or indicators.adx == 0:
-                self.update_signal_time("SELL")
-                
-                result.signal = Signal.SELL
-                final_confidence = min(sell_score * vol_multiplier * adx_tp_multiplier * confluence_multiplier * regime_multiplier, 1.0)
-                result.confidence = final_confidence
-                result.reason = " | ".join(sell_reasons)
-                
-                result.reason += f" | Confluence: {confluence_score:.0f}/100 ({confidence_level})"
-                result.reason += f" | 🎯Pred: {pred_direction} ({pred_confidence:.0%})"
-                
-                if vol_multiplier < 1.0:
-                    result.reason += f" | Vol Zone: {vol_zone} ({vol_multiplier:.0%})"
-                
-                logger.info(f"🔴 SELL Signal: score={sell_score:.2f}, confluence={confluence_score:.0f}/100, regime={regime_multiplier:.2f}, final_conf={final_confidence:.2f}, ADX={indicators.adx:.1f}, Pred={pred_direction}({pred_confidence:.0%})")
-                return result
+            if final_result is not None:
+                return final_result
                 
         result.signal = Signal.WAIT
         result.confidence = 0.0
         ema_trend = self.check_ema_trend()
-        result.reason = f"RSI={indicators.rsi:.1f} | ADX={indicators.adx:.1f} | EMA Trend={ema_trend} | Waiting for clear signal"
+        result.reason = f"RSI={rsi:.1f} | ADX={adx:.1f} | EMA Trend={ema_trend} | Waiting for clear signal"
         
         # Log more details at INFO level for debugging signal generation
-        logger.info(f"⏳ WAIT: buy={buy_score:.2f} sell={sell_score:.2f} need={self.MIN_CONFIDENCE_THRESHOLD} | RSI={indicators.rsi:.1f} ADX={indicators.adx:.1f}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "⏳ WAIT: buy=%.2f sell=%.2f need=%s | RSI=%.1f ADX=%.1f",
+                buy_score, sell_score, min_confidence, rsi, adx
+            )
         
         return result
         
+    def _finalize_signal(self, result: AnalysisResult, side: Signal, score: float,
+                         reasons: List[str], indicators: IndicatorValues,
+                         vol_zone: str, vol_multiplier: float) -> Optional[AnalysisResult]:
+        """Jalankan gate BUY/SELL dan isi result untuk sisi yang diberikan.
+        
+        Gate diurutkan dari yang paling murah: cooldown -> ADX -> confluence ->
+        prediction -> regime. predict_tick_direction() (multi-horizon + semua
+        faktor) adalah yang termahal, jadi hanya dijalankan untuk sinyal yang
+        sudah lolos gate lain.
+        
+        Args:
+            result: AnalysisResult yang sedang dibangun oleh analyze()
+            side: Signal.BUY atau Signal.SELL
+            score: Skor sisi tersebut
+            reasons: List alasan untuk sisi tersebut (di-extend in place)
+            indicators: Nilai indikator tick ini
+            vol_zone: Volatility zone
+            vol_multiplier: Volatility multiplier
+            
+        Returns:
+            result yang sudah final (signal atau WAIT karena diblokir), atau
+            None jika ADX filter gagal sehingga analyze() lanjut ke WAIT default
+        """
+        signal_type = "BUY" if side is Signal.BUY else "SELL"
+        expected_direction = "UP" if side is Signal.BUY else "DOWN"
+        
+        cooldown_ok, cooldown_reason = self.should_generate_signal(signal_type)
+        if not cooldown_ok:
+            result.signal = Signal.WAIT
+            result.confidence = 0.0
+            result.reason = cooldown_reason
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("⏳ %s blocked by cooldown: %s", signal_type, cooldown_reason)
+            return result
+        
+        adx_valid, adx_reason, adx_tp_multiplier = self.check_adx_filter(
+            indicators.adx, indicators.plus_di, indicators.minus_di, signal_type
+        )
+        
+        if not adx_valid:
+            # ADX hard block: sinyal pasti ditolak, tidak perlu hitung
+            # confluence/prediction (analyze() fallback ke WAIT)
+            return None
+        reasons.append(adx_reason)
+        
+        confluence_score, confidence_level, confluence_details = self.get_confluence_score(
+            signal_type, indicators
+        )
+        
+        if confluence_score < self.MIN_CONFLUENCE_SCORE and confidence_level == "WEAK":
+            result.signal = Signal.WAIT
+            result.confidence = 0.0
+            result.reason = f"Confluence too weak ({confluence_score:.0f}/100) | Failed: {confluence_details.get('filters_failed', [])}"
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("⏳ %s blocked by weak confluence: %.0f/100", signal_type, confluence_score)
+            return result
+        
+        pred_direction, pred_confidence = self.predict_tick_direction(look_ahead=5)
+        
+        if pred_direction != expected_direction:
+            result.signal = Signal.WAIT
+            result.confidence = 0.0
+            result.reason = f"🎯 Prediction conflict: {signal_type} signal but predicted {pred_direction} (conf={pred_confidence:.2f})"
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "🚫 %s blocked by prediction: %s vs %s required (conf=%.2f)",
+                    signal_type, pred_direction, expected_direction, pred_confidence
+                )
+            return result
+        
+        if pred_confidence < self.MIN_PREDICTION_CONFIDENCE:
+            result.signal = Signal.WAIT
+            result.confidence = 0.0
+            result.reason = f"🎯 Low prediction confidence: {pred_confidence:.2f} < {self.MIN_PREDICTION_CONFIDENCE} for {signal_type}"
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "🚫 %s blocked by low prediction confidence: %.2f < %s",
+                    signal_type, pred_confidence, self.MIN_PREDICTION_CONFIDENCE
+                )
+            return result
+        
+        if confidence_level == "STRONG":
+            confluence_multiplier = 1.15
+        elif confidence_level == "MEDIUM":
+            confluence_multiplier = 1.0
+        else:
+            confluence_multiplier = 0.85
+        
+        # Regime-aware score adjustment v4.3
+        regime_multiplier, regime_reason = self.get_regime_score_adjustment(signal_type, indicators)
+        reasons.append(regime_reason)
+        
+        self.update_signal_time(signal_type)
+        
+        result.signal = side
+        final_confidence = min(score * vol_multiplier * adx_tp_multiplier * confluence_multiplier * regime_multiplier, 1.0)
+        result.confidence = final_confidence
+        result.reason = " | ".join(reasons)
+        
+        result.reason += f" | Confluence: {confluence_score:.0f}/100 ({confidence_level})"
+        result.reason += f" | 🎯Pred: {pred_direction} ({pred_confidence:.0%})"
+        
+        if vol_multiplier < 1.0:
+            result.reason += f" | Vol Zone: {vol_zone} ({vol_multiplier:.0%})"
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "%s %s Signal: score=%.2f, confluence=%.0f/100, regime=%.2f, final_conf=%.2f, ADX=%.1f, Pred=%s(%.0f%%)",
+                "🟢" if side is Signal.BUY else "🔴", signal_type,
+                score, confluence_score, regime_multiplier, final_confidence,
+                indicators.adx, pred_direction, pred_confidence * 100
+            )
+        return result
+        
     def get_current_price(self) -> Optional[float]:
         """Dapatkan harga tick terakhir"""
         if self.tick_history:
@@ -3395,7 +3594,7 @@ class TradingStrategy:
             contract_type: "CALL" atau "PUT"
             
         Returns:
-            Tuple (take_profit_price, stop_loss_price)
+            Tuple (take_profit_price, stop_loss_price), tidak di-round
         """
         atr = self.last_indicators.atr if self.last_indicators.atr > 0 else 0.0001
         
@@ -3408,8 +3607,9 @@ class TradingStrategy:
         else:
             tp_price = entry_price - tp_distance
             sl_price = entry_price + sl_distance
-            
-        return round(tp_price, 5), round(sl_price, 5)
+        
+        # Harga dikembalikan apa adanya; format dengan :.5f saat ditampilkan
+        return tp_price, sl_price
     
     def analyze_tick_direction(self, window_size: int = 50) -> TickPickerData:
         """
@@ -3475,6 +3675,21 @@ class TradingStrategy:
             window_size=window_size
         )
         
+    @property
+    def tick_count(self) -> int:
+        """Jumlah tick di history (sama dengan get_stats()['tick_count'])"""
+        return len(self.tick_history)
+    
+    @property
+    def current_rsi(self) -> float:
+        """RSI dari last_indicators, tanpa menghitung ulang indikator"""
+        return self.last_indicators.rsi if self.tick_history else 50.0
+    
+    @property
+    def current_trend(self) -> str:
+        """Arah trend dari last_indicators, tanpa menghitung ulang indikator"""
+        return self.last_indicators.trend_direction if self.tick_history else "N/A"
+    
     def get_stats(self) -> dict:
         """
         Dapatkan statistik analisis saat ini.
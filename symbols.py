@@ -7,168 +7,166 @@ Setiap symbol memiliki setting khusus untuk durasi dan stake.
 =============================================================
 """
 
+import sys
+import types
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Tuple
 
 
-@dataclass
+# Capability bitmask untuk SymbolConfig.caps
+CAP_TICKS = 1
+CAP_MINUTES = 2
+CAP_DAYS = 4
+
+
+@dataclass(frozen=True, slots=True)
 class SymbolConfig:
-    """Konfigurasi untuk satu trading symbol"""
+    """Konfigurasi untuk satu trading symbol (immutable)"""
     symbol: str
     name: str
     min_stake: float
     min_duration: int
     max_duration: int
     duration_unit: str
-    supports_ticks: bool
-    supports_minutes: bool
-    supports_days: bool
+    caps: int  # kombinasi CAP_TICKS | CAP_MINUTES | CAP_DAYS
     category: str
     description: str
-
-
-SUPPORTED_SYMBOLS: dict[str, SymbolConfig] = {
-    "R_100": SymbolConfig(
-        symbol="R_100",
-        name="Volatility 100 Index",
-        min_stake=0.50,
-        min_duration=5,
-        max_duration=10,
-        duration_unit="t",
-        supports_ticks=True,
-        supports_minutes=True,
-        supports_days=False,
-        category="Synthetic",
-        description="Default - Ideal untuk short-term trading"
-    ),
-    "R_75": SymbolConfig(
-        symbol="R_75",
-        name="Volatility 75 Index",
-        min_stake=0.50,
-        min_duration=5,
-        max_duration=10,
-        duration_unit="t",
-        supports_ticks=True,
-        supports_minutes=True,
-        supports_days=False,
-        category="Synthetic",
-        description="Medium volatility - short-term trading"
-    ),
-    "R_50": SymbolConfig(
-        symbol="R_50",
-        name="Volatility 50 Index",
-        min_stake=0.50,
-        min_duration=5,
-        max_duration=10,
-        duration_unit="t",
-        supports_ticks=True,
-        supports_minutes=True,
-        supports_days=False,
-        category="Synthetic",
-        description="Lower volatility - short-term trading"
-    ),
-    "R_25": SymbolConfig(
-        symbol="R_25",
-        name="Volatility 25 Index",
-        min_stake=0.50,
-        min_duration=5,
-        max_duration=10,
-        duration_unit="t",
-        supports_ticks=True,
-        supports_minutes=True,
-        supports_days=False,
-        category="Synthetic",
-        description="Low volatility - more stable"
-    ),
-    "R_10": SymbolConfig(
-        symbol="R_10",
-        name="Volatility 10 Index",
-        min_stake=0.50,
-        min_duration=5,
-        max_duration=10,
-        duration_unit="t",
-        supports_ticks=True,
-        supports_minutes=True,
-        supports_days=False,
-        category="Synthetic",
-        description="Lowest volatility - very stable"
-    ),
-    "1HZ100V": SymbolConfig(
-        symbol="1HZ100V",
-        name="Volatility 100 (1s) Index",
-        min_stake=0.50,
-        min_duration=5,
-        max_duration=10,
-        duration_unit="t",
-        supports_ticks=True,
-        supports_minutes=True,
-        supports_days=False,
-        category="Synthetic",
-        description="1 second ticks - very fast"
-    ),
-    "1HZ75V": SymbolConfig(
-        symbol="1HZ75V",
-        name="Volatility 75 (1s) Index",
-        min_stake=0.50,
-        min_duration=5,
-        max_duration=10,
-        duration_unit="t",
-        supports_ticks=True,
-        supports_minutes=True,
-        supports_days=False,
-        category="Synthetic",
-        description="1 second ticks - fast"
-    ),
-    "1HZ50V": SymbolConfig(
-        symbol="1HZ50V",
-        name="Volatility 50 (1s) Index",
-        min_stake=0.50,
-        min_duration=5,
-        max_duration=10,
-        duration_unit="t",
-        supports_ticks=True,
-        supports_minutes=True,
-        supports_days=False,
-        category="Synthetic",
-        description="1 second ticks - medium"
-    ),
-    "frxXAUUSD": SymbolConfig(
-        symbol="frxXAUUSD",
-        name="Gold/USD (XAU/USD)",
-        min_stake=0.50,
-        min_duration=1,
-        max_duration=365,
-        duration_unit="d",
-        supports_ticks=False,
-        supports_minutes=False,
-        supports_days=True,
-        category="Commodities",
-        description="HANYA durasi HARIAN - min 1 hari!"
-    ),
+    
+    def __post_init__(self) -> None:
+        # category/duration_unit dipakai sebagai dict key dan untuk perbandingan
+        # berulang; intern agar semua instance berbagi satu objek string
+        object.__setattr__(self, "category", sys.intern(self.category))
+        object.__setattr__(self, "duration_unit", sys.intern(self.duration_unit))
+    
+    @property
+    def supports_ticks(self) -> bool:
+        return bool(self.caps & CAP_TICKS)
+    
+    @property
+    def supports_minutes(self) -> bool:
+        return bool(self.caps & CAP_MINUTES)
+    
+    @property
+    def supports_days(self) -> bool:
+        return bool(self.caps & CAP_DAYS)
+
+
+# Semua synthetic index short-term memakai setting yang sama; hanya
+# symbol, nama, dan deskripsi yang berbeda
+_SHORT_TERM_DEFAULTS = dict(
+    min_stake=0.50,
+    min_duration=5,
+    max_duration=10,
+    duration_unit="t",
+    caps=CAP_TICKS | CAP_MINUTES,
+    category="Synthetic",
+)
+
+_SHORT_TERM_ROWS: Tuple[Tuple[str, str, str], ...] = (
+    ("R_100", "Volatility 100 Index", "Default - Ideal untuk short-term trading"),
+    ("R_75", "Volatility 75 Index", "Medium volatility - short-term trading"),
+    ("R_50", "Volatility 50 Index", "Lower volatility - short-term trading"),
+    ("R_25", "Volatility 25 Index", "Low volatility - more stable"),
+    ("R_10", "Volatility 10 Index", "Lowest volatility - very stable"),
+    ("1HZ100V", "Volatility 100 (1s) Index", "1 second ticks - very fast"),
+    ("1HZ75V", "Volatility 75 (1s) Index", "1 second ticks - fast"),
+    ("1HZ50V", "Volatility 50 (1s) Index", "1 second ticks - medium"),
+)
+
+_SUPPORTED_SYMBOLS_RAW: dict[str, SymbolConfig] = {
+    symbol: SymbolConfig(symbol=symbol, name=name, description=description, **_SHORT_TERM_DEFAULTS)
+    for symbol, name, description in _SHORT_TERM_ROWS
 }
+_SUPPORTED_SYMBOLS_RAW["frxXAUUSD"] = SymbolConfig(
+    symbol="frxXAUUSD",
+    name="Gold/USD (XAU/USD)",
+    min_stake=0.50,
+    min_duration=1,
+    max_duration=365,
+    duration_unit="d",
+    caps=CAP_DAYS,
+    category="Commodities",
+    description="HANYA durasi HARIAN - min 1 hari!"
+)
+
+# View read-only: index di bawah dibangun sekali dari registry ini, jadi
+# registry tidak boleh dimodifikasi saat runtime
+SUPPORTED_SYMBOLS: Mapping[str, SymbolConfig] = types.MappingProxyType(_SUPPORTED_SYMBOLS_RAW)
 
 DEFAULT_SYMBOL = "R_100"
 MIN_STAKE_GLOBAL = 0.50
 
 
-def get_symbol_config(symbol: str) -> Optional[SymbolConfig]:
-    """Dapatkan konfigurasi untuk symbol tertentu"""
-    return SUPPORTED_SYMBOLS.get(symbol)
+# Index read-only yang dibangun sekali saat import. Registry tidak berubah
+# saat runtime, jadi getter cukup mengembalikan tuple yang sudah jadi.
+# Caller yang perlu memodifikasi hasilnya harus membuat list sendiri.
+def _build_category_index() -> Dict[str, Tuple[SymbolConfig, ...]]:
+    index: Dict[str, List[SymbolConfig]] = {}
+    for s in SUPPORTED_SYMBOLS.values():
+        index.setdefault(s.category, []).append(s)
+    return {category: tuple(configs) for category, configs in index.items()}
 
 
-def get_symbols_by_category(category: str) -> List[SymbolConfig]:
+_BY_CATEGORY: Dict[str, Tuple[SymbolConfig, ...]] = _build_category_index()
+_SHORT_TERM: Tuple[SymbolConfig, ...] = tuple(
+    s for s in SUPPORTED_SYMBOLS.values() if s.caps & CAP_TICKS
+)
+_LONG_TERM: Tuple[SymbolConfig, ...] = tuple(
+    s for s in SUPPORTED_SYMBOLS.values() if s.caps & (CAP_DAYS | CAP_TICKS) == CAP_DAYS
+)
+
+
+# Dapatkan konfigurasi untuk symbol tertentu (None jika tidak dikenal).
+# Bound method dict.get langsung, tanpa frame wrapper Python per lookup.
+get_symbol_config: Callable[[str], Optional[SymbolConfig]] = _SUPPORTED_SYMBOLS_RAW.get
+
+
+def get_symbols_by_category(category: str) -> Tuple[SymbolConfig, ...]:
     """Dapatkan semua symbol dalam kategori tertentu"""
-    return [s for s in SUPPORTED_SYMBOLS.values() if s.category == category]
+    return _BY_CATEGORY.get(category, ())
 
 
-def get_short_term_symbols() -> List[SymbolConfig]:
+def get_short_term_symbols() -> Tuple[SymbolConfig, ...]:
     """Dapatkan symbol yang mendukung short-term trading (ticks)"""
-    return [s for s in SUPPORTED_SYMBOLS.values() if s.supports_ticks]
+    return _SHORT_TERM
 
 
-def get_long_term_symbols() -> List[SymbolConfig]:
+def get_long_term_symbols() -> Tuple[SymbolConfig, ...]:
     """Dapatkan symbol yang hanya mendukung long-term trading (days)"""
-    return [s for s in SUPPORTED_SYMBOLS.values() if s.supports_days and not s.supports_ticks]
+    return _LONG_TERM
+
+
+def iter_short_term_symbols() -> Iterator[SymbolConfig]:
+    """Iterasi symbol short-term tanpa membuat container baru"""
+    return iter(_SHORT_TERM)
+
+
+def iter_long_term_symbols() -> Iterator[SymbolConfig]:
+    """Iterasi symbol long-term tanpa membuat container baru"""
+    return iter(_LONG_TERM)
+
+
+# Unit durasi -> capability bit yang dibutuhkan, plus template error
+_UNIT_MASK: Dict[str, int] = {
+    "t": CAP_TICKS,
+    "m": CAP_MINUTES,
+    "s": CAP_MINUTES,
+    "d": CAP_DAYS,
+}
+_UNIT_ERROR_TEMPLATE: Dict[str, str] = {
+    "t": "{name} tidak mendukung durasi ticks. Gunakan durasi harian (d).",
+    "m": "{name} tidak mendukung durasi menit/detik. Gunakan durasi harian (d).",
+    "s": "{name} tidak mendukung durasi menit/detik. Gunakan durasi harian (d).",
+    "d": "{name} tidak mendukung durasi harian.",
+}
+
+# Error message per (symbol, unit) yang tidak didukung, dirakit saat import
+_UNIT_ERRORS: Dict[Tuple[str, str], str] = {
+    (config.symbol, unit): _UNIT_ERROR_TEMPLATE[unit].format(name=config.name)
+    for config in SUPPORTED_SYMBOLS.values()
+    for unit, mask in _UNIT_MASK.items()
+    if not config.caps & mask
+}
 
 
 def validate_duration_for_symbol(symbol: str, duration: int, duration_unit: str) -> tuple[bool, str]:
@@ -183,32 +181,28 @@ def validate_duration_for_symbol(symbol: str, duration: int, duration_unit: str)
     Returns:
         Tuple (is_valid, error_message)
     """
-    config = get_symbol_config(symbol)
-    if not config:
+    if symbol not in SUPPORTED_SYMBOLS:
         return False, f"Symbol '{symbol}' tidak dikenal"
     
-    if duration_unit == "t" and not config.supports_ticks:
-        return False, f"{config.name} tidak mendukung durasi ticks. Gunakan durasi harian (d)."
-    
-    if duration_unit in ["m", "s"] and not config.supports_minutes:
-        return False, f"{config.name} tidak mendukung durasi menit/detik. Gunakan durasi harian (d)."
-    
-    if duration_unit == "d" and not config.supports_days:
-        return False, f"{config.name} tidak mendukung durasi harian."
+    error = _UNIT_ERRORS.get((symbol, duration_unit))
+    if error is not None:
+        return False, error
     
     return True, ""
 
 
+# Text /symbols dirakit sekali saat import dari index yang immutable
+_SHORT_LINES: Tuple[str, ...] = tuple(f"• `{s.symbol}` - {s.name}" for s in _SHORT_TERM)
+_LONG_LINES: Tuple[str, ...] = tuple(f"• `{s.symbol}` - {s.name} ⚠️ HARIAN SAJA" for s in _LONG_TERM)
+_SYMBOL_LIST_TEXT: str = "\n".join((
+    "📊 **TRADING PAIRS TERSEDIA**\n",
+    "**Synthetic (Short-term):**",
+    *_SHORT_LINES,
+    "\n**Commodities (Long-term):**",
+    *_LONG_LINES,
+))
+
+
 def get_symbol_list_text() -> str:
     """Generate text list semua symbol untuk display di Telegram"""
-    lines = ["📊 **TRADING PAIRS TERSEDIA**\n"]
-    
-    lines.append("**Synthetic (Short-term):**")
-    for sym in get_short_term_symbols():
-        lines.append(f"• `{sym.symbol}` - {sym.name}")
-    
-    lines.append("\n**Commodities (Long-term):**")
-    for sym in get_long_term_symbols():
-        lines.append(f"• `{sym.symbol}` - {sym.name} ⚠️ HARIAN SAJA")
-    
-    return "\n".join(lines)
+    return _SYMBOL_LIST_TEXT
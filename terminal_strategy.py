@@ -22,11 +22,13 @@ Minimum confidence untuk trade: 0.80 (80%)
 =============================================================
 """
 
-from typing import List, Optional, Dict, Tuple, Any
+from typing import Optional, Dict, Tuple, Any, Iterable
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 from collections import deque
+from array import array
+from bisect import bisect_left
 import logging
 import math
 
@@ -56,6 +58,26 @@ class SignalDirection(Enum):
     WAIT = "WAIT"
 
 
+# Arah per-indikator di _calculate_probability (int, bukan string)
+_DIR_PUT = -1
+_DIR_NEUTRAL = 0
+_DIR_CALL = 1
+
+# Hybrid Recovery per risk level: (base_multiplier, max_level)
+_RECOVERY_TIERS = {
+    RiskLevel.LOW: (2.0, 5),
+    RiskLevel.MEDIUM: (1.8, 4),
+    RiskLevel.HIGH: (1.5, 3),
+    RiskLevel.VERY_HIGH: (1.3, 2),
+}
+
+# base_multiplier ** level untuk level 0..max_level, dihitung sekali saat import
+_MULTIPLIER_POWERS = {
+    risk_level: tuple(base_multiplier ** level for level in range(max_level + 1))
+    for risk_level, (base_multiplier, max_level) in _RECOVERY_TIERS.items()
+}
+
+
 @dataclass
 class TerminalSignal:
     """Hasil sinyal Terminal Strategy"""
@@ -107,6 +129,13 @@ class TerminalStrategy:
     MACD_SLOW = 26
     MACD_SIGNAL = 9
     
+    # Smoothing constant EMA: k = 2 / (period + 1)
+    EMA_FAST_K = 2 / (EMA_FAST_PERIOD + 1)
+    EMA_SLOW_K = 2 / (EMA_SLOW_PERIOD + 1)
+    MACD_FAST_K = 2 / (MACD_FAST + 1)
+    MACD_SLOW_K = 2 / (MACD_SLOW + 1)
+    MACD_SIGNAL_K = 2 / (MACD_SIGNAL + 1)
+    
     STOCH_PERIOD = 14
     STOCH_SMOOTH = 3
     STOCH_OVERSOLD = 20
@@ -130,24 +159,52 @@ class TerminalStrategy:
     VOLATILITY_MEDIUM = 0.003
     VOLATILITY_HIGH = 0.005
     
+    # Batas atas (inklusif) tiap risk level, urut naik - lihat _determine_risk_level
+    _RISK_THRESHOLDS = (VOLATILITY_LOW, VOLATILITY_MEDIUM, VOLATILITY_HIGH)
+    _RISK_LEVELS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.VERY_HIGH)
+    
     def __init__(self):
         """Inisialisasi Terminal Strategy"""
-        self.tick_history: deque = deque(maxlen=self.MAX_TICK_HISTORY)
-        self.high_history: deque = deque(maxlen=self.MAX_TICK_HISTORY)
-        self.low_history: deque = deque(maxlen=self.MAX_TICK_HISTORY)
+        # History disimpan sebagai array('d') paralel (price/high/low) - double
+        # kontigu 8 byte/elemen, dipotong ke MAX_TICK_HISTORY di add_tick()
+        self.tick_history: 'array[float]' = array('d')
+        self.high_history: 'array[float]' = array('d')
+        self.low_history: 'array[float]' = array('d')
         self.total_ticks: int = 0
         
-        self._ema_fast_cache: Optional[float] = None
-        self._ema_slow_cache: Optional[float] = None
-        self._macd_ema_fast_cache: Optional[float] = None
-        self._macd_ema_slow_cache: Optional[float] = None
-        self._macd_signal_cache: Optional[float] = None
+        # EMA incremental, di-update setiap tick di add_tick()
+        self._ema_seed_sum: float = 0.0
+        self._ema_fast: float = 0.0
+        self._ema_slow: float = 0.0
+        self._macd_ema_fast: float = 0.0
+        self._macd_ema_slow: float = 0.0
+        self._macd_seed_sum: float = 0.0
+        self._macd_signal: float = 0.0
         
         self._rsi_gains: deque = deque(maxlen=self.RSI_PERIOD)
         self._rsi_losses: deque = deque(maxlen=self.RSI_PERIOD)
+        self._rsi_gain_sum: float = 0.0
+        self._rsi_loss_sum: float = 0.0
+        
+        # Monotonic deque (index, nilai) untuk rolling max high / min low
+        # Stochastic, plus %K terakhir untuk smoothing %D
+        self._stoch_hi: deque = deque()
+        self._stoch_lo: deque = deque()
+        self._stoch_k_values: deque = deque(maxlen=self.STOCH_SMOOTH)
+        
+        # Return per tick untuk window volatility + rolling sum/sum of squares
+        self._returns: deque = deque(maxlen=self.VOLATILITY_PERIOD - 1)
+        self._ret_sum: float = 0.0
+        self._ret_sumsq: float = 0.0
         
         self._last_price: float = 0.0
         
+        # Cache hasil per tick (key: total_ticks)
+        self._indicators_tick: int = -1
+        self._indicators_cache: Dict[str, float] = {}
+        self._analysis_tick: int = -1
+        self._analysis_cache: Optional[TerminalAnalysisResult] = None
+        
         self.consecutive_wins: int = 0
         self.consecutive_losses: int = 0
         
@@ -163,6 +220,43 @@ class TerminalStrategy:
         if not self._is_valid_price(price):
             return
         
+        self._push_tick(price)
+    
+    def add_ticks(self, prices: Iterable[float]) -> int:
+        """
+        Tambahkan banyak tick sekaligus (preload history / backtest).
+        
+        Hasilnya sama dengan memanggil add_tick() untuk setiap harga secara
+        berurutan, tanpa overhead pemanggilan add_tick() per tick.
+        
+        Args:
+            prices: Harga tick, urut dari yang terlama
+        
+        Returns:
+            Jumlah tick valid yang ditambahkan
+        """
+        # Validasi satu batch: float biasa cukup dicek 0 < price < inf (NaN,
+        # inf dan harga <= 0 gagal), tipe lain lewat _is_valid_price()
+        is_valid = self._is_valid_price
+        inf = math.inf
+        valid_prices = [
+            price for price in prices
+            if (0.0 < price < inf if type(price) is float else is_valid(price))
+        ]
+        
+        push_tick = self._push_tick
+        for price in valid_prices:
+            push_tick(price)
+        
+        return len(valid_prices)
+    
+    def _push_tick(self, price: float) -> None:
+        """Simpan tick yang sudah divalidasi dan update state incremental"""
+        if len(self.tick_history) >= self.MAX_TICK_HISTORY:
+            del self.tick_history[0]
+            del self.high_history[0]
+            del self.low_history[0]
+        
         self.tick_history.append(price)
         self.total_ticks += 1
         
@@ -172,12 +266,8 @@ class TerminalStrategy:
             low = min(price, prev_price)
             
             change = price - prev_price
-            if change > 0:
-                self._rsi_gains.append(change)
-                self._rsi_losses.append(0)
-            else:
-                self._rsi_gains.append(0)
-                self._rsi_losses.append(abs(change))
+            self._update_rsi_sums(change)
+            self._update_return_moments(change / prev_price)
         else:
             high = price
             low = price
@@ -186,9 +276,8 @@ class TerminalStrategy:
         self.low_history.append(low)
         
         self._last_price = price
-        
-        if self.total_ticks % 10 == 0:
-            self._update_indicator_caches()
+        self._update_emas(price)
+        self._update_stochastic(price, high, low)
     
     def _is_valid_price(self, price: float) -> bool:
         """Validasi harga"""
@@ -203,34 +292,94 @@ class TerminalStrategy:
         except (TypeError, ValueError):
             return False
     
-    def _update_indicator_caches(self) -> None:
-        """Update cached indicator values"""
-        if len(self.tick_history) >= self.EMA_FAST_PERIOD:
-            self._ema_fast_cache = self._calculate_ema(list(self.tick_history), self.EMA_FAST_PERIOD)
+    def _update_emas(self, price: float) -> None:
+        """
+        Update semua EMA secara incremental (O(1) per tick).
+        
+        Selama jumlah tick belum mencapai period, EMA = SMA dari tick yang ada
+        (seed SMA); setelah itu pakai rekursi EMA biasa.
+        """
+        n = self.total_ticks
+        if n <= self.MACD_SLOW:
+            self._ema_seed_sum += price
+        
+        self._ema_fast = self._ema_step(self._ema_fast, price, n, self.EMA_FAST_PERIOD, self.EMA_FAST_K)
+        self._ema_slow = self._ema_step(self._ema_slow, price, n, self.EMA_SLOW_PERIOD, self.EMA_SLOW_K)
+        self._macd_ema_fast = self._ema_step(self._macd_ema_fast, price, n, self.MACD_FAST, self.MACD_FAST_K)
+        self._macd_ema_slow = self._ema_step(self._macd_ema_slow, price, n, self.MACD_SLOW, self.MACD_SLOW_K)
+        
+        # Signal line = EMA(MACD_SIGNAL) dari MACD line, dimulai saat MACD
+        # line pertama tersedia (tick ke-MACD_SLOW)
+        if n >= self.MACD_SLOW:
+            macd_line = self._macd_ema_fast - self._macd_ema_slow
+            m = n - self.MACD_SLOW + 1
+            if m <= self.MACD_SIGNAL:
+                self._macd_seed_sum += macd_line
+                self._macd_signal = self._macd_seed_sum / m
+            else:
+                k = self.MACD_SIGNAL_K
+                self._macd_signal = macd_line * k + self._macd_signal * (1 - k)
+    
+    def _ema_step(self, ema: float, price: float, n: int, period: int, k: float) -> float:
+        """Satu langkah EMA untuk tick ke-n dengan smoothing constant k"""
+        if n <= period:
+            return self._ema_seed_sum / n
+        
+        return price * k + ema * (1 - k)
+    
+    def _update_rsi_sums(self, change: float) -> None:
+        """
+        Geser window gain/loss RSI dan update jumlahnya secara rolling.
+        
+        Jumlah di-resync dari deque setiap RSI_PERIOD tick supaya error
+        floating point dari tambah/kurang tidak menumpuk.
+        """
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
         
-        if len(self.tick_history) >= self.EMA_SLOW_PERIOD:
-            self._ema_slow_cache = self._calculate_ema(list(self.tick_history), self.EMA_SLOW_PERIOD)
+        if len(self._rsi_gains) == self.RSI_PERIOD:
+            self._rsi_gain_sum -= self._rsi_gains[0]
+            self._rsi_loss_sum -= self._rsi_losses[0]
+        
+        self._rsi_gains.append(gain)
+        self._rsi_losses.append(loss)
+        
+        if self.total_ticks % self.RSI_PERIOD == 0:
+            self._rsi_gain_sum = sum(self._rsi_gains)
+            self._rsi_loss_sum = sum(self._rsi_losses)
+        else:
+            self._rsi_gain_sum += gain
+            self._rsi_loss_sum += loss
     
-    def _calculate_ema(self, prices: List[float], period: int) -> float:
-        """Calculate Exponential Moving Average"""
-        if len(prices) < period:
-            return sum(prices) / len(prices) if prices else 0.0
+    def _update_return_moments(self, ret: float) -> None:
+        """
+        Geser window return volatility dan update sum / sum of squares.
         
-        k = 2 / (period + 1)
-        ema = sum(prices[:period]) / period
+        Seperti RSI, jumlah di-resync dari deque setiap VOLATILITY_PERIOD
+        tick supaya error floating point tidak menumpuk.
+        """
+        returns = self._returns
+        if len(returns) == returns.maxlen:
+            old = returns[0]
+            self._ret_sum -= old
+            self._ret_sumsq -= old * old
         
-        for price in prices[period:]:
-            ema = price * k + ema * (1 - k)
+        returns.append(ret)
         
-        return ema
+        if self.total_ticks % self.VOLATILITY_PERIOD == 0:
+            self._ret_sum = sum(returns)
+            self._ret_sumsq = sum([r * r for r in returns])
+        else:
+            self._ret_sum += ret
+            self._ret_sumsq += ret * ret
     
     def _calculate_rsi(self) -> float:
         """Calculate RSI (Relative Strength Index)"""
         if len(self._rsi_gains) < self.RSI_PERIOD:
             return 50.0
         
-        avg_gain = sum(self._rsi_gains) / len(self._rsi_gains)
-        avg_loss = sum(self._rsi_losses) / len(self._rsi_losses)
+        avg_gain = self._rsi_gain_sum / self.RSI_PERIOD
+        avg_loss = self._rsi_loss_sum / self.RSI_PERIOD
         
         if avg_loss == 0:
             return 100.0
@@ -247,35 +396,50 @@ class TerminalStrategy:
         Returns:
             (macd_line, signal_line, histogram)
         """
-        prices = list(self.tick_history)
-        
-        if len(prices) < self.MACD_SLOW:
+        if self.total_ticks < self.MACD_SLOW:
             return 0.0, 0.0, 0.0
         
-        ema_fast = self._calculate_ema(prices, self.MACD_FAST)
-        ema_slow = self._calculate_ema(prices, self.MACD_SLOW)
-        
-        macd_line = ema_fast - ema_slow
-        
-        macd_values = []
-        for i in range(self.MACD_SLOW, len(prices) + 1):
-            subset = prices[:i]
-            fast = self._calculate_ema(subset, self.MACD_FAST)
-            slow = self._calculate_ema(subset, self.MACD_SLOW)
-            macd_values.append(fast - slow)
-        
-        if len(macd_values) >= self.MACD_SIGNAL:
-            signal_line = self._calculate_ema(macd_values, self.MACD_SIGNAL)
-        else:
-            signal_line = sum(macd_values) / len(macd_values) if macd_values else 0.0
-        
+        macd_line = self._macd_ema_fast - self._macd_ema_slow
+        signal_line = self._macd_signal
         histogram = macd_line - signal_line
         
         return macd_line, signal_line, histogram
     
+    def _update_stochastic(self, price: float, high: float, low: float) -> None:
+        """
+        Update rolling max/min Stochastic dan hitung %K untuk tick ini.
+        
+        Memakai monotonic deque sehingga highest high / lowest low dari
+        STOCH_PERIOD tick terakhir didapat dalam O(1) amortized.
+        """
+        idx = self.total_ticks
+        expired = idx - self.STOCH_PERIOD
+        
+        stoch_hi = self._stoch_hi
+        while stoch_hi and stoch_hi[-1][1] <= high:
+            stoch_hi.pop()
+        stoch_hi.append((idx, high))
+        if stoch_hi[0][0] <= expired:
+            stoch_hi.popleft()
+        
+        stoch_lo = self._stoch_lo
+        while stoch_lo and stoch_lo[-1][1] >= low:
+            stoch_lo.pop()
+        stoch_lo.append((idx, low))
+        if stoch_lo[0][0] <= expired:
+            stoch_lo.popleft()
+        
+        hh = stoch_hi[0][1]
+        ll = stoch_lo[0][1]
+        
+        if hh != ll:
+            self._stoch_k_values.append(((price - ll) / (hh - ll)) * 100)
+        else:
+            self._stoch_k_values.append(50.0)
+    
     def _calculate_stochastic(self) -> Tuple[float, float]:
         """
-        Calculate Stochastic Oscillator
+        Calculate Stochastic Oscillator dari %K yang di-update di add_tick()
         
         Returns:
             (stoch_k, stoch_d)
@@ -283,38 +447,9 @@ class TerminalStrategy:
         if len(self.tick_history) < self.STOCH_PERIOD:
             return 50.0, 50.0
         
-        prices = list(self.tick_history)[-self.STOCH_PERIOD:]
-        highs = list(self.high_history)[-self.STOCH_PERIOD:]
-        lows = list(self.low_history)[-self.STOCH_PERIOD:]
-        
-        highest_high = max(highs)
-        lowest_low = min(lows)
-        current_price = prices[-1]
-        
-        if highest_high == lowest_low:
-            stoch_k = 50.0
-        else:
-            stoch_k = ((current_price - lowest_low) / (highest_high - lowest_low)) * 100
-        
-        k_values = []
-        for i in range(max(0, len(self.tick_history) - self.STOCH_SMOOTH), len(self.tick_history)):
-            subset_prices = list(self.tick_history)[max(0, i - self.STOCH_PERIOD + 1):i + 1]
-            subset_highs = list(self.high_history)[max(0, i - self.STOCH_PERIOD + 1):i + 1]
-            subset_lows = list(self.low_history)[max(0, i - self.STOCH_PERIOD + 1):i + 1]
-            
-            if not subset_prices:
-                continue
-                
-            hh = max(subset_highs) if subset_highs else subset_prices[-1]
-            ll = min(subset_lows) if subset_lows else subset_prices[-1]
-            cp = subset_prices[-1]
-            
-            if hh != ll:
-                k_values.append(((cp - ll) / (hh - ll)) * 100)
-            else:
-                k_values.append(50.0)
-        
-        stoch_d = sum(k_values) / len(k_values) if k_values else stoch_k
+        k_values = self._stoch_k_values
+        stoch_k = k_values[-1]
+        stoch_d = sum(k_values) / len(k_values)
         
         return stoch_k, stoch_d
     
@@ -328,37 +463,31 @@ class TerminalStrategy:
         if len(self.tick_history) < self.ADX_PERIOD + 1:
             return 0.0, 0.0, 0.0
         
-        prices = list(self.tick_history)
-        highs = list(self.high_history)
-        lows = list(self.low_history)
-        
-        plus_dm_list = []
-        minus_dm_list = []
-        tr_list = []
-        
-        for i in range(1, len(prices)):
-            high_diff = highs[i] - highs[i-1] if i < len(highs) else 0
-            low_diff = lows[i-1] - lows[i] if i < len(lows) else 0
+        # Hanya ADX_PERIOD perubahan terakhir yang dijumlahkan, jadi cukup
+        # ambil ADX_PERIOD + 1 tick terakhir
+        span = self.ADX_PERIOD + 1
+        prices = self.tick_history[-span:]
+        highs = self.high_history[-span:]
+        lows = self.low_history[-span:]
+        
+        smoothed_tr = 0.0
+        smoothed_plus_dm = 0.0
+        smoothed_minus_dm = 0.0
+        
+        for i in range(1, span):
+            high = highs[i]
+            low = lows[i]
+            prev_price = prices[i-1]
             
-            plus_dm = high_diff if high_diff > low_diff and high_diff > 0 else 0
-            minus_dm = low_diff if low_diff > high_diff and low_diff > 0 else 0
+            high_diff = high - highs[i-1]
+            low_diff = lows[i-1] - low
             
-            plus_dm_list.append(plus_dm)
-            minus_dm_list.append(minus_dm)
+            if high_diff > low_diff and high_diff > 0:
+                smoothed_plus_dm += high_diff
+            if low_diff > high_diff and low_diff > 0:
+                smoothed_minus_dm += low_diff
             
-            tr = max(
-                highs[i] - lows[i] if i < len(highs) and i < len(lows) else 0,
-                abs(highs[i] - prices[i-1]) if i < len(highs) else 0,
-                abs(lows[i] - prices[i-1]) if i < len(lows) else 0
-            )
-            tr_list.append(tr)
-        
-        if len(tr_list) < self.ADX_PERIOD:
-            return 0.0, 0.0, 0.0
-        
-        smoothed_tr = sum(tr_list[-self.ADX_PERIOD:])
-        smoothed_plus_dm = sum(plus_dm_list[-self.ADX_PERIOD:])
-        smoothed_minus_dm = sum(minus_dm_list[-self.ADX_PERIOD:])
+            smoothed_tr += max(high - low, abs(high - prev_price), abs(low - prev_price))
         
         if smoothed_tr == 0:
             return 0.0, 0.0, 0.0
@@ -377,31 +506,62 @@ class TerminalStrategy:
         return adx, plus_di, minus_di
     
     def _calculate_volatility(self) -> float:
-        """Calculate price volatility"""
+        """Calculate price volatility (std return VOLATILITY_PERIOD tick terakhir)"""
         if len(self.tick_history) < self.VOLATILITY_PERIOD:
             return 0.0
         
-        prices = list(self.tick_history)[-self.VOLATILITY_PERIOD:]
+        n = len(self._returns)
+        mean_return = self._ret_sum / n
+        variance = max(0.0, self._ret_sumsq / n - mean_return * mean_return)
+        volatility = math.sqrt(variance)
         
-        returns = []
-        for i in range(1, len(prices)):
-            if prices[i-1] != 0:
-                ret = (prices[i] - prices[i-1]) / prices[i-1]
-                returns.append(ret)
+        return volatility
+    
+    def _compute_all(self) -> Dict[str, float]:
+        """
+        Hitung semua indikator sekaligus.
         
-        if not returns:
-            return 0.0
+        RSI, EMA, MACD, Stochastic dan Volatility dibaca dari state
+        incremental yang di-update di add_tick(); hanya ADX yang membaca
+        window ADX_PERIOD + 1 tick terakhir.
         
-        mean_return = sum(returns) / len(returns)
-        variance = sum((r - mean_return) ** 2 for r in returns) / len(returns)
-        volatility = math.sqrt(variance)
+        Hasil di-cache per tick sehingga analyze() dan get_stats() pada
+        tick yang sama tidak menghitung ulang.
         
-        return volatility
+        Returns:
+            Dictionary berisi nilai mentah setiap indikator
+        """
+        if self._indicators_tick == self.total_ticks:
+            return self._indicators_cache
+        
+        macd_line, signal_line, histogram = self._calculate_macd()
+        stoch_k, stoch_d = self._calculate_stochastic()
+        adx, plus_di, minus_di = self._calculate_adx()
+        
+        self._indicators_tick = self.total_ticks
+        self._indicators_cache = {
+            'rsi': self._calculate_rsi(),
+            'ema_fast': self._ema_fast,
+            'ema_slow': self._ema_slow,
+            'macd_line': macd_line,
+            'macd_signal': signal_line,
+            'macd_histogram': histogram,
+            'stoch_k': stoch_k,
+            'stoch_d': stoch_d,
+            'adx': adx,
+            'plus_di': plus_di,
+            'minus_di': minus_di,
+            'volatility': self._calculate_volatility()
+        }
+        return self._indicators_cache
     
-    def _calculate_probability(self) -> Dict[str, float]:
+    def _calculate_probability(self, indicators: Dict[str, float]) -> Dict[str, float]:
         """
         Hitung probability scoring dari multiple indicators.
         
+        Args:
+            indicators: Hasil _compute_all()
+        
         Returns:
             Dictionary dengan scores untuk setiap indicator dan total
         """
@@ -418,94 +578,81 @@ class TerminalStrategy:
         if self.total_ticks < self.MIN_TICKS_REQUIRED:
             return scores
         
-        rsi = self._calculate_rsi()
+        rsi = indicators['rsi']
         rsi_score = 0.0
-        rsi_direction = 'NEUTRAL'
+        rsi_direction = _DIR_NEUTRAL
         
         if rsi <= self.RSI_OVERSOLD:
             rsi_score = min(1.0, (self.RSI_OVERSOLD - rsi) / self.RSI_OVERSOLD + 0.5)
-            rsi_direction = 'CALL'
+            rsi_direction = _DIR_CALL
         elif rsi >= self.RSI_OVERBOUGHT:
             rsi_score = min(1.0, (rsi - self.RSI_OVERBOUGHT) / (100 - self.RSI_OVERBOUGHT) + 0.5)
-            rsi_direction = 'PUT'
+            rsi_direction = _DIR_PUT
         else:
             distance_to_extreme = min(abs(rsi - self.RSI_OVERSOLD), abs(rsi - self.RSI_OVERBOUGHT))
             rsi_score = max(0.0, 0.3 - distance_to_extreme / 100)
         
         scores['rsi'] = rsi_score
         
-        prices = list(self.tick_history)
-        ema_fast = self._calculate_ema(prices, self.EMA_FAST_PERIOD)
-        ema_slow = self._calculate_ema(prices, self.EMA_SLOW_PERIOD)
+        ema_fast = indicators['ema_fast']
+        ema_slow = indicators['ema_slow']
         
+        ema_gap = ema_fast - ema_slow
         ema_score = 0.0
-        ema_direction = 'NEUTRAL'
+        ema_direction = _DIR_NEUTRAL
         
-        if ema_fast > ema_slow:
-            diff_pct = (ema_fast - ema_slow) / ema_slow if ema_slow != 0 else 0
-            ema_score = min(1.0, 0.5 + diff_pct * 100)
-            ema_direction = 'CALL'
-        elif ema_fast < ema_slow:
-            diff_pct = (ema_slow - ema_fast) / ema_slow if ema_slow != 0 else 0
+        # Skor simetris: hanya arah yang bergantung pada tanda gap
+        if ema_gap:
+            diff_pct = abs(ema_gap) / ema_slow if ema_slow != 0 else 0
             ema_score = min(1.0, 0.5 + diff_pct * 100)
-            ema_direction = 'PUT'
+            ema_direction = _DIR_CALL if ema_gap > 0 else _DIR_PUT
         
         scores['ema'] = ema_score
         
-        macd_line, signal_line, histogram = self._calculate_macd()
+        histogram = indicators['macd_histogram']
         macd_score = 0.0
-        macd_direction = 'NEUTRAL'
+        macd_direction = _DIR_NEUTRAL
         
-        if histogram > 0:
-            macd_score = min(1.0, 0.5 + abs(histogram) * 1000)
-            macd_direction = 'CALL'
-        elif histogram < 0:
+        if histogram:
             macd_score = min(1.0, 0.5 + abs(histogram) * 1000)
-            macd_direction = 'PUT'
+            macd_direction = _DIR_CALL if histogram > 0 else _DIR_PUT
         
         scores['macd'] = macd_score
         
-        stoch_k, stoch_d = self._calculate_stochastic()
+        stoch_k = indicators['stoch_k']
+        stoch_d = indicators['stoch_d']
         stoch_score = 0.0
-        stoch_direction = 'NEUTRAL'
+        stoch_direction = _DIR_NEUTRAL
         
         if stoch_k <= self.STOCH_OVERSOLD:
             stoch_score = min(1.0, (self.STOCH_OVERSOLD - stoch_k) / self.STOCH_OVERSOLD + 0.5)
-            stoch_direction = 'CALL'
+            stoch_direction = _DIR_CALL
         elif stoch_k >= self.STOCH_OVERBOUGHT:
             stoch_score = min(1.0, (stoch_k - self.STOCH_OVERBOUGHT) / (100 - self.STOCH_OVERBOUGHT) + 0.5)
-            stoch_direction = 'PUT'
-        else:
-            if stoch_k > stoch_d:
-                stoch_score = 0.4
-                stoch_direction = 'CALL'
-            elif stoch_k < stoch_d:
-                stoch_score = 0.4
-                stoch_direction = 'PUT'
+            stoch_direction = _DIR_PUT
+        elif stoch_k != stoch_d:
+            stoch_score = 0.4
+            stoch_direction = _DIR_CALL if stoch_k > stoch_d else _DIR_PUT
         
         scores['stoch'] = stoch_score
         
-        adx, plus_di, minus_di = self._calculate_adx()
+        adx = indicators['adx']
+        plus_di = indicators['plus_di']
+        minus_di = indicators['minus_di']
         adx_score = 0.0
-        adx_direction = 'NEUTRAL'
+        adx_direction = _DIR_NEUTRAL
         
-        if adx >= self.ADX_STRONG_TREND:
+        # Trend lemah (ADX_WEAK_TREND..ADX_STRONG_TREND) selalu < 0.5 sehingga
+        # clamp ke 1.0 cukup satu untuk kedua zona
+        if adx >= self.ADX_WEAK_TREND:
             adx_score = min(1.0, adx / 50)
-            if plus_di > minus_di:
-                adx_direction = 'CALL'
-            else:
-                adx_direction = 'PUT'
-        elif adx >= self.ADX_WEAK_TREND:
-            adx_score = adx / 50
-            if plus_di > minus_di:
-                adx_direction = 'CALL'
-            else:
-                adx_direction = 'PUT'
+            adx_direction = _DIR_CALL if plus_di > minus_di else _DIR_PUT
         
         scores['adx'] = adx_score
         
-        call_count = sum(1 for d in [rsi_direction, ema_direction, macd_direction, stoch_direction, adx_direction] if d == 'CALL')
-        put_count = sum(1 for d in [rsi_direction, ema_direction, macd_direction, stoch_direction, adx_direction] if d == 'PUT')
+        directions = (rsi_direction, ema_direction, macd_direction, stoch_direction, adx_direction)
+        call_count = directions.count(_DIR_CALL)
+        put_count = directions.count(_DIR_PUT)
         
         if call_count > put_count:
             direction = 'CALL'
@@ -528,55 +675,32 @@ class TerminalStrategy:
         
         return scores
     
-    def _determine_risk_level(self) -> RiskLevel:
+    def _determine_risk_level(self, volatility: float) -> RiskLevel:
         """
         Tentukan risk level berdasarkan volatility.
         
         Returns:
             RiskLevel enum value
         """
-        volatility = self._calculate_volatility()
-        
-        if volatility <= self.VOLATILITY_LOW:
-            return RiskLevel.LOW
-        elif volatility <= self.VOLATILITY_MEDIUM:
-            return RiskLevel.MEDIUM
-        elif volatility <= self.VOLATILITY_HIGH:
-            return RiskLevel.HIGH
-        else:
-            return RiskLevel.VERY_HIGH
+        return self._RISK_LEVELS[bisect_left(self._RISK_THRESHOLDS, volatility)]
     
-    def _get_recovery_config(self) -> Dict[str, Any]:
+    def _get_recovery_config(self, risk_level: RiskLevel) -> Dict[str, Any]:
         """
         Return config untuk Hybrid Recovery system.
         
         Hybrid = Martingale ketika losing streak, Anti-Martingale ketika winning
         
+        Args:
+            risk_level: Risk level dari _determine_risk_level()
+        
         Returns:
             Dictionary dengan recovery configuration
         """
-        risk_level = self._determine_risk_level()
-        
-        base_multiplier = 1.0
-        max_level = 5
-        recovery_mode = RecoveryMode.HYBRID
-        
-        if risk_level == RiskLevel.LOW:
-            base_multiplier = 2.0
-            max_level = 5
-        elif risk_level == RiskLevel.MEDIUM:
-            base_multiplier = 1.8
-            max_level = 4
-        elif risk_level == RiskLevel.HIGH:
-            base_multiplier = 1.5
-            max_level = 3
-        else:
-            base_multiplier = 1.3
-            max_level = 2
+        base_multiplier, max_level = _RECOVERY_TIERS[risk_level]
         
         if self.consecutive_losses >= 2:
             recovery_mode = RecoveryMode.MARTINGALE
-            current_multiplier = base_multiplier ** min(self.consecutive_losses, max_level)
+            current_multiplier = _MULTIPLIER_POWERS[risk_level][min(self.consecutive_losses, max_level)]
         elif self.consecutive_wins >= 2:
             recovery_mode = RecoveryMode.ANTI_MARTINGALE
             current_multiplier = 1.0 + (self.consecutive_wins * 0.2)
@@ -604,10 +728,14 @@ class TerminalStrategy:
         if self.total_ticks < self.MIN_TICKS_REQUIRED:
             return None
         
-        probability_scores = self._calculate_probability()
-        risk_level = self._determine_risk_level()
-        recovery_config = self._get_recovery_config()
-        volatility = self._calculate_volatility()
+        if self._analysis_tick == self.total_ticks:
+            return self._analysis_cache
+        
+        indicators = self._compute_all()
+        probability_scores = self._calculate_probability(indicators)
+        volatility = indicators['volatility']
+        risk_level = self._determine_risk_level(volatility)
+        recovery_config = self._get_recovery_config(risk_level)
         
         total_probability = probability_scores['total']
         direction_str = probability_scores['direction']
@@ -649,7 +777,8 @@ class TerminalStrategy:
             'ADX': probability_scores['adx']
         }
         
-        return TerminalAnalysisResult(
+        self._analysis_tick = self.total_ticks
+        self._analysis_cache = TerminalAnalysisResult(
             signal=signal,
             probability=total_probability,
             indicators_used=indicators_used,
@@ -662,6 +791,7 @@ class TerminalStrategy:
             volatility=volatility,
             tick_count=self.total_ticks
         )
+        return self._analysis_cache
     
     def get_signal_for_trading(self) -> Optional[TerminalSignal]:
         """
@@ -693,21 +823,22 @@ class TerminalStrategy:
         else:
             self.consecutive_losses += 1
             self.consecutive_wins = 0
+        
+        # Recovery mode di hasil analyze() bergantung pada streak
+        self._analysis_tick = -1
     
     def reset_streaks(self) -> None:
         """Reset win/loss streaks"""
         self.consecutive_wins = 0
         self.consecutive_losses = 0
+        self._analysis_tick = -1
     
     def get_stats(self) -> Dict[str, Any]:
         """Get current strategy statistics"""
-        volatility = self._calculate_volatility()
-        risk_level = self._determine_risk_level()
-        recovery_config = self._get_recovery_config()
-        
-        rsi = self._calculate_rsi() if self.total_ticks >= self.RSI_PERIOD else 50.0
-        stoch_k, stoch_d = self._calculate_stochastic()
-        adx, plus_di, minus_di = self._calculate_adx()
+        indicators = self._compute_all()
+        volatility = indicators['volatility']
+        risk_level = self._determine_risk_level(volatility)
+        recovery_config = self._get_recovery_config(risk_level)
         
         return {
             'tick_count': self.total_ticks,
@@ -717,30 +848,45 @@ class TerminalStrategy:
             'current_multiplier': recovery_config['current_multiplier'],
             'consecutive_wins': self.consecutive_wins,
             'consecutive_losses': self.consecutive_losses,
-            'rsi': rsi,
-            'stoch_k': stoch_k,
-            'stoch_d': stoch_d,
-            'adx': adx,
-            'plus_di': plus_di,
-            'minus_di': minus_di,
+            'rsi': indicators['rsi'],
+            'stoch_k': indicators['stoch_k'],
+            'stoch_d': indicators['stoch_d'],
+            'adx': indicators['adx'],
+            'plus_di': indicators['plus_di'],
+            'minus_di': indicators['minus_di'],
             'ready': self.total_ticks >= self.MIN_TICKS_REQUIRED
         }
     
     def clear_history(self) -> None:
         """Reset semua history dan caches"""
-        self.tick_history.clear()
-        self.high_history.clear()
-        self.low_history.clear()
+        del self.tick_history[:]
+        del self.high_history[:]
+        del self.low_history[:]
         self._rsi_gains.clear()
         self._rsi_losses.clear()
+        self._rsi_gain_sum = 0.0
+        self._rsi_loss_sum = 0.0
+        self._stoch_hi.clear()
+        self._stoch_lo.clear()
+        self._stoch_k_values.clear()
+        self._returns.clear()
+        self._ret_sum = 0.0
+        self._ret_sumsq = 0.0
         self.total_ticks = 0
         self._last_price = 0.0
         
-        self._ema_fast_cache = None
-        self._ema_slow_cache = None
-        self._macd_ema_fast_cache = None
-        self._macd_ema_slow_cache = None
-        self._macd_signal_cache = None
+        self._ema_seed_sum = 0.0
+        self._ema_fast = 0.0
+        self._ema_slow = 0.0
+        self._macd_ema_fast = 0.0
+        self._macd_ema_slow = 0.0
+        self._macd_seed_sum = 0.0
+        self._macd_signal = 0.0
+        
+        self._indicators_tick = -1
+        self._indicators_cache = {}
+        self._analysis_tick = -1
+        self._analysis_cache = None
         
         self.consecutive_wins = 0
         self.consecutive_losses = 0
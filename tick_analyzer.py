@@ -22,8 +22,10 @@ Terinspirasi dari:
 from typing import List, Optional, Dict, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
-from collections import deque
+from array import array
+from bisect import bisect_left, insort
 from datetime import datetime
+from itertools import groupby
 import logging
 import math
 
@@ -38,6 +40,14 @@ class TickDirection(Enum):
     NEUTRAL = "NEUTRAL"
 
 
+# Arah tick internal sebagai int; TickDirection hanya dipakai di API publik.
+# _DIR_ENUM[d] memetakan balik (index -1 = elemen terakhir = DOWN).
+_UP = 1
+_DOWN = -1
+_NEUTRAL = 0
+_DIR_ENUM = (TickDirection.NEUTRAL, TickDirection.UP, TickDirection.DOWN)
+
+
 class TrendStrength(Enum):
     """Kekuatan trend"""
     STRONG = "STRONG"
@@ -58,7 +68,7 @@ class PatternType(Enum):
     NO_PATTERN = "NO_PATTERN"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TickSignal:
     """Signal hasil analisis tick"""
     direction: TickDirection
@@ -71,7 +81,7 @@ class TickSignal:
     take_profit: Optional[float] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MomentumData:
     """Data momentum calculation"""
     short_momentum: float  # 5 tick momentum
@@ -82,7 +92,7 @@ class MomentumData:
     is_decelerating: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class VolatilityData:
     """Data volatilitas"""
     current_volatility: float
@@ -115,6 +125,7 @@ class TickTrendAnalyzer:
     
     # Volatility settings
     VOLATILITY_WINDOW = 20
+    VOLATILITY_HISTORY_SIZE = 100
     HIGH_VOLATILITY_PERCENTILE = 75
     LOW_VOLATILITY_PERCENTILE = 25
     
@@ -128,22 +139,35 @@ class TickTrendAnalyzer:
     
     def __init__(self):
         """Initialize Tick Trend Analyzer"""
-        self.tick_history: deque = deque(maxlen=self.MAX_TICK_HISTORY)
-        self.direction_history: deque = deque(maxlen=self.MAX_TICK_HISTORY)
-        self.volatility_history: deque = deque(maxlen=100)
+        # Harga disimpan di array('d') (double kontigu), dipotong ke
+        # MAX_TICK_HISTORY di add_tick() - momentum cukup baca per index
+        self.tick_history: 'array[float]' = array('d')
+        # Arah tiap tick sebagai int (_UP/_DOWN/_NEUTRAL), sejajar dengan tick_history
+        self.direction_history: 'array[int]' = array('b')
+        # Perubahan harga (rasio) per tick, dipotong ke VOLATILITY_HISTORY_SIZE
+        self.volatility_history: 'array[float]' = array('d')
+        # Salinan terurut + running sum dari volatility_history untuk
+        # percentile (bisect) dan rata-rata tanpa sort/sum ulang
+        self._vol_sorted: List[float] = []
+        self._vol_sum: float = 0.0
         
         self.total_ticks: int = 0
         self.last_price: float = 0.0
         
         # Streak tracking
         self.current_streak: int = 0
-        self.streak_direction: TickDirection = TickDirection.NEUTRAL
+        self._streak_dir: int = _NEUTRAL
         self.max_up_streak: int = 0
         self.max_down_streak: int = 0
         
         # Momentum tracking
         self.momentum_data: Optional[MomentumData] = None
         
+        # Memo _detect_pattern(), keyed on total_ticks - pattern hanya
+        # berubah saat ada tick baru
+        self._pattern_cache: PatternType = PatternType.NO_PATTERN
+        self._pattern_cache_tick: int = -1
+        
         # Support/Resistance
         self.support_levels: List[float] = []
         self.resistance_levels: List[float] = []
@@ -164,39 +188,64 @@ class TickTrendAnalyzer:
         Returns:
             Direction of tick movement
         """
-        if not self._is_valid_price(price):
+        # Jalur cepat untuk float: NaN gagal di kedua perbandingan, inf
+        # gagal di batas atas; tipe lain tetap lewat _is_valid_price()
+        if not (0.0 < price < math.inf if type(price) is float else self._is_valid_price(price)):
             return None
         
-        self.tick_history.append(price)
+        # Update per tick digabung di sini (tanpa helper per langkah) karena
+        # add_tick() dipanggil untuk setiap tick yang masuk
+        tick_history = self.tick_history
+        direction_history = self.direction_history
+        if len(tick_history) >= self.MAX_TICK_HISTORY:
+            del tick_history[0]
+            del direction_history[0]
+        tick_history.append(price)
         self.total_ticks += 1
-        
-        # Calculate direction
-        direction = self._calculate_direction(price)
-        self.direction_history.append(direction)
-        
-        # Update stats
-        if direction == TickDirection.UP:
-            self.up_ticks += 1
-        elif direction == TickDirection.DOWN:
-            self.down_ticks += 1
-        
-        # Update streak
-        self._update_streak(direction)
-        
-        # Update volatility
-        self._update_volatility(price)
+        total_ticks = self.total_ticks
+        
+        # Calculate direction + volatility (tick pertama selalu NEUTRAL)
+        last_price = self.last_price
+        if last_price > 0:
+            diff = price - last_price
+            direction = _UP if diff > 0 else (_DOWN if diff < 0 else _NEUTRAL)
+            self._update_volatility(abs(diff) / last_price)
+        else:
+            direction = _NEUTRAL
+        direction_history.append(direction)
+        
+        # Update stats - hasil perbandingan (bool) dijumlahkan sebagai 0/1
+        self.up_ticks += direction == _UP
+        self.down_ticks += direction == _DOWN
+        
+        # Update streak - tick NEUTRAL tidak mengubah streak
+        if direction != _NEUTRAL:
+            streak_dir = self._streak_dir
+            if direction == streak_dir:
+                self.current_streak += 1
+            else:
+                # Streak broken
+                if streak_dir == _UP:
+                    if self.current_streak > self.max_up_streak:
+                        self.max_up_streak = self.current_streak
+                elif streak_dir == _DOWN:
+                    if self.current_streak > self.max_down_streak:
+                        self.max_down_streak = self.current_streak
+                
+                self._streak_dir = direction
+                self.current_streak = 1
         
         # Update momentum
-        if self.total_ticks >= self.SHORT_WINDOW:
+        if total_ticks >= self.SHORT_WINDOW:
             self._update_momentum()
         
         # Update support/resistance periodically
-        if self.total_ticks % 50 == 0:
+        if total_ticks % 50 == 0:
             self._update_support_resistance()
         
         self.last_price = price
         
-        return direction
+        return _DIR_ENUM[direction]
     
     def _is_valid_price(self, price: float) -> bool:
         """Validate price"""
@@ -211,61 +260,76 @@ class TickTrendAnalyzer:
         except (TypeError, ValueError):
             return False
     
-    def _calculate_direction(self, price: float) -> TickDirection:
-        """Calculate tick direction"""
-        if self.last_price == 0.0:
-            return TickDirection.NEUTRAL
+    @property
+    def streak_direction(self) -> TickDirection:
+        """Arah streak saat ini sebagai TickDirection"""
+        return _DIR_ENUM[self._streak_dir]
+    
+    def recompute_streaks(self) -> Dict[str, int]:
+        """
+        Hitung ulang streak up/down terpanjang dari direction_history.
         
-        diff = price - self.last_price
+        Untuk resync atau laporan histori, tanpa menambah kerja di add_tick().
+        Sama seperti di add_tick(), tick NEUTRAL tidak memutus streak.
+        Berbeda dengan max_up_streak/max_down_streak, streak yang masih
+        berjalan ikut dihitung, tapi hanya dalam window MAX_TICK_HISTORY.
         
-        if diff > 0:
-            return TickDirection.UP
-        elif diff < 0:
-            return TickDirection.DOWN
-        else:
-            return TickDirection.NEUTRAL
-    
-    def _update_streak(self, direction: TickDirection) -> None:
-        """Update streak tracking"""
-        if direction == TickDirection.NEUTRAL:
-            return
+        Returns:
+            Dictionary dengan max_up_streak dan max_down_streak
+        """
+        max_runs = {_UP: 0, _DOWN: 0}
         
-        if direction == self.streak_direction:
-            self.current_streak += 1
-        else:
-            # Streak broken
-            if self.streak_direction == TickDirection.UP:
-                if self.current_streak > self.max_up_streak:
-                    self.max_up_streak = self.current_streak
-            elif self.streak_direction == TickDirection.DOWN:
-                if self.current_streak > self.max_down_streak:
-                    self.max_down_streak = self.current_streak
-            
-            self.streak_direction = direction
-            self.current_streak = 1
+        for direction, run in groupby(d for d in self.direction_history if d):
+            length = sum(1 for _ in run)
+            if length > max_runs[direction]:
+                max_runs[direction] = length
+        
+        return {
+            'max_up_streak': max_runs[_UP],
+            'max_down_streak': max_runs[_DOWN]
+        }
     
-    def _update_volatility(self, price: float) -> None:
-        """Update volatility calculation"""
-        if self.last_price > 0:
-            change = abs(price - self.last_price)
-            pct_change = change / self.last_price
-            self.volatility_history.append(pct_change)
+    def _update_volatility(self, pct_change: float) -> None:
+        """Masukkan perubahan harga absolut (rasio) ke window volatility"""
+        history = self.volatility_history
+        vol_sorted = self._vol_sorted
+        if len(history) >= self.VOLATILITY_HISTORY_SIZE:
+            oldest = history[0]
+            del history[0]
+            del vol_sorted[bisect_left(vol_sorted, oldest)]
+            self._vol_sum -= oldest
+        
+        history.append(pct_change)
+        insort(vol_sorted, pct_change)
+        
+        # Resync berkala supaya error floating point tidak menumpuk
+        if self.total_ticks % self.VOLATILITY_HISTORY_SIZE == 0:
+            self._vol_sum = sum(history)
+        else:
+            self._vol_sum += pct_change
     
     def _update_momentum(self) -> None:
         """Update momentum calculations"""
-        prices = list(self.tick_history)
+        prices = self.tick_history
         
         if len(prices) < self.LONG_WINDOW:
             return
         
-        # Calculate momentum for different windows
-        short_momentum = self._calculate_momentum(prices[-self.SHORT_WINDOW:])
-        medium_momentum = self._calculate_momentum(prices[-self.MEDIUM_WINDOW:])
-        long_momentum = self._calculate_momentum(prices[-self.LONG_WINDOW:])
+        # Momentum = rate of change (%) dari harga awal tiap window ke harga
+        # terakhir. Harga sudah divalidasi > 0 di add_tick() jadi aman dibagi.
+        current_price = prices[-1]
+        short_start = prices[-self.SHORT_WINDOW]
+        medium_start = prices[-self.MEDIUM_WINDOW]
+        long_start = prices[-self.LONG_WINDOW]
+        
+        short_momentum = (current_price - short_start) / short_start * 100
+        medium_momentum = (current_price - medium_start) / medium_start * 100
+        long_momentum = (current_price - long_start) / long_start * 100
         
         # Calculate acceleration (momentum of momentum)
         if len(prices) >= self.MEDIUM_WINDOW + 5:
-            prev_momentum = self._calculate_momentum(prices[-(self.MEDIUM_WINDOW + 5):-5])
+            prev_start = prices[-(self.MEDIUM_WINDOW + 5)]
+            prev_momentum = (prices[-6] - prev_start) / prev_start * 100
             acceleration = medium_momentum - prev_momentum
         else:
             acceleration = 0.0
@@ -279,25 +343,13 @@ class TickTrendAnalyzer:
             is_decelerating=acceleration < 0 or (acceleration > 0 and medium_momentum < 0)
         )
     
-    def _calculate_momentum(self, prices: List[float]) -> float:
-        """Calculate momentum sebagai rate of change"""
-        if len(prices) < 2:
-            return 0.0
-        
-        first_price = prices[0]
-        last_price = prices[-1]
-        
-        if first_price == 0:
-            return 0.0
-        
-        return (last_price - first_price) / first_price * 100
-    
     def _update_support_resistance(self) -> None:
         """Update support and resistance levels"""
         if len(self.tick_history) < 50:
             return
         
-        prices = list(self.tick_history)[-100:]
+        # Slice array langsung - hanya 100 harga terakhir yang disalin
+        prices = self.tick_history[-100:]
         
         # Simple pivot point calculation
         highest = max(prices)
@@ -314,17 +366,16 @@ class TickTrendAnalyzer:
     
     def get_volatility_data(self) -> Optional[VolatilityData]:
         """Get current volatility data"""
-        if len(self.volatility_history) < 10:
+        count = len(self.volatility_history)
+        if count < 10:
             return None
         
-        vol_list = list(self.volatility_history)
-        current = vol_list[-1] if vol_list else 0
-        average = sum(vol_list) / len(vol_list)
+        current = self.volatility_history[-1]
+        average = self._vol_sum / count
         
-        # Calculate percentile
-        sorted_vol = sorted(vol_list)
-        position = sorted_vol.index(current) if current in sorted_vol else len(sorted_vol) // 2
-        percentile = (position / len(sorted_vol)) * 100
+        # Percentile = posisi pertama current di history yang sudah terurut
+        position = bisect_left(self._vol_sorted, current)
+        percentile = (position / count) * 100
         
         return VolatilityData(
             current_volatility=current,
@@ -347,16 +398,14 @@ class TickTrendAnalyzer:
         if len(self.tick_history) < 2:
             return None
         
-        current_price = self.tick_history[-1]
-        
-        # Detect pattern
-        pattern = self._detect_pattern()
+        # last_price selalu sama dengan tick_history[-1] (di-set di add_tick)
+        current_price = self.last_price
         
-        # Calculate base confidence
-        base_confidence = 0.50
+        # Pattern tidak menghasilkan signal sendiri (sudah tercakup oleh
+        # streak dan momentum), jadi _detect_pattern() hanya untuk get_summary()
         
         # Analyze streak
-        streak_signal = self._analyze_streak()
+        streak_signal = self._analyze_streak(current_price)
         if streak_signal:
             return streak_signal
         
@@ -365,32 +414,38 @@ class TickTrendAnalyzer:
         if momentum_signal:
             return momentum_signal
         
-        # Analyze pattern-based signals
-        pattern_signal = self._analyze_pattern(pattern, current_price)
-        if pattern_signal:
-            return pattern_signal
-        
         return None
     
     def _detect_pattern(self) -> PatternType:
-        """Detect current market pattern"""
+        """Detect current market pattern (memoized per tick)"""
+        if self._pattern_cache_tick != self.total_ticks:
+            self._pattern_cache = self._compute_pattern()
+            self._pattern_cache_tick = self.total_ticks
+        return self._pattern_cache
+    
+    def _compute_pattern(self) -> PatternType:
+        """Hitung pattern dari 20 tick terakhir, streak dan momentum"""
         if self.total_ticks < self.MIN_TICKS_REQUIRED:
             return PatternType.NO_PATTERN
         
-        prices = list(self.tick_history)[-20:]
+        # Slice langsung dari array, tanpa menyalin seluruh history
+        prices = self.tick_history[-20:]
+        count = len(prices)
         
-        if len(prices) < 10:
+        if count < 10:
             return PatternType.NO_PATTERN
         
-        # Calculate trend
-        first_half_avg = sum(prices[:10]) / 10
-        second_half_avg = sum(prices[10:]) / len(prices[10:])
+        # Calculate trend - kedua setengah dijumlah sekali, dipakai ulang untuk avg_price
+        first_half_sum = sum(prices[:10])
+        second_half_sum = sum(prices[10:])
+        first_half_avg = first_half_sum / 10
+        second_half_avg = second_half_sum / (count - 10)
         
         change_pct = (second_half_avg - first_half_avg) / first_half_avg if first_half_avg > 0 else 0
         
         # Check for consolidation
         price_range = max(prices) - min(prices)
-        avg_price = sum(prices) / len(prices)
+        avg_price = (first_half_sum + second_half_sum) / count
         range_pct = price_range / avg_price if avg_price > 0 else 0
         
         if range_pct < self.CONSOLIDATION_THRESHOLD:
@@ -398,11 +453,11 @@ class TickTrendAnalyzer:
         
         # Check for reversal
         if self.current_streak >= self.REVERSAL_STREAK_MIN:
-            if self.streak_direction == TickDirection.UP:
+            if self._streak_dir == _UP:
                 # Long uptrend, might reverse down
                 if self.momentum_data and self.momentum_data.is_decelerating:
                     return PatternType.REVERSAL_DOWN
-            elif self.streak_direction == TickDirection.DOWN:
+            elif self._streak_dir == _DOWN:
                 # Long downtrend, might reverse up
                 if self.momentum_data and self.momentum_data.is_decelerating:
                     return PatternType.REVERSAL_UP
@@ -415,13 +470,11 @@ class TickTrendAnalyzer:
         
         return PatternType.NO_PATTERN
     
-    def _analyze_streak(self) -> Optional[TickSignal]:
+    def _analyze_streak(self, current_price: float) -> Optional[TickSignal]:
         """Analyze streak untuk signal generation"""
         if self.current_streak < self.MIN_STREAK_FOR_SIGNAL:
             return None
         
-        current_price = self.tick_history[-1]
-        
         # Calculate confidence based on streak length
         streak_factor = min(self.current_streak / 10, 1.0)
         
@@ -431,7 +484,7 @@ class TickTrendAnalyzer:
             confidence = 0.55 + (streak_factor * 0.15)
             confidence = min(confidence, 0.75)
             
-            if self.streak_direction == TickDirection.UP:
+            if self._streak_dir == _UP:
                 # After strong up streak, expect down
                 return TickSignal(
                     direction=TickDirection.DOWN,
@@ -458,7 +511,7 @@ class TickTrendAnalyzer:
                 # Momentum confirms trend
                 confidence = 0.58 + (streak_factor * 0.10)
                 
-                if self.streak_direction == TickDirection.UP:
+                if self._streak_dir == _UP:
                     return TickSignal(
                         direction=TickDirection.UP,
                         strength=TrendStrength.MODERATE,
@@ -540,18 +593,6 @@ class TickTrendAnalyzer:
         
         return None
     
-    def _analyze_pattern(self, pattern: PatternType, current_price: float) -> Optional[TickSignal]:
-        """Generate signal based on detected pattern"""
-        if pattern == PatternType.NO_PATTERN:
-            return None
-        
-        if pattern == PatternType.CONSOLIDATION:
-            # No clear direction in consolidation
-            return None
-        
-        # Pattern-based signals sudah di-generate oleh streak dan momentum analysis
-        return None
-    
     def get_stats(self) -> Dict[str, Any]:
         """Get current statistics"""
         up_pct = self.up_ticks / self.total_ticks * 100 if self.total_ticks > 0 else 50
@@ -599,19 +640,23 @@ class TickTrendAnalyzer:
     
     def clear_history(self) -> None:
         """Reset all history"""
-        self.tick_history.clear()
-        self.direction_history.clear()
-        self.volatility_history.clear()
+        del self.tick_history[:]
+        del self.direction_history[:]
+        del self.volatility_history[:]
+        self._vol_sorted.clear()
+        self._vol_sum = 0.0
         
         self.total_ticks = 0
         self.last_price = 0.0
         self.current_streak = 0
-        self.streak_direction = TickDirection.NEUTRAL
+        self._streak_dir = _NEUTRAL
         self.max_up_streak = 0
         self.max_down_streak = 0
         self.up_ticks = 0
         self.down_ticks = 0
         self.momentum_data = None
+        self._pattern_cache = PatternType.NO_PATTERN
+        self._pattern_cache_tick = -1
         self.support_levels.clear()
         self.resistance_levels.clear()
         
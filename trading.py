@@ -34,14 +34,18 @@ Enhancement v2.2:
 import asyncio
 import logging
 import json
+import queue
+import random
 import shutil
-import tempfile
 import threading
-from typing import Optional, Callable, Dict, Any, List
+import time
+from time import monotonic
+from typing import Optional, Callable, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timedelta
 from collections import deque
+from bisect import bisect_right
 
 from strategy import TradingStrategy, Signal, AnalysisResult, TrendFollowingStrategy, BollingerBandsStrategy, SupportResistanceStrategy
 from deriv_ws import DerivWebSocket, AccountType
@@ -79,6 +83,13 @@ LOGS_DIR = "logs"
 if not os.path.exists(LOGS_DIR):
     os.makedirs(LOGS_DIR)
 
+# Header CSV journal trade (dipakai saat validasi, repair, dan tulis file baru)
+EXPECTED_JOURNAL_HEADER = (
+    "timestamp", "trade_number", "symbol", "type",
+    "entry_price", "exit_price", "stake", "payout",
+    "profit", "is_win", "rsi", "trend"
+)
+
 
 class TradingState(Enum):
     """Status trading session"""
@@ -89,6 +100,16 @@ class TradingState(Enum):
     STOPPED = "stopped"
 
 
+def _to_cents(amount: float) -> int:
+    """Konversi nominal USD ke sen (int) untuk akumulasi tanpa drift floating point"""
+    return int(round(amount * 100))
+
+
+def _from_cents(cents: int) -> float:
+    """Konversi sen (int) kembali ke nominal USD"""
+    return cents / 100.0
+
+
 class StrategyMode(Enum):
     """Mode strategi trading"""
     MULTI_INDICATOR = "multi_indicator"  # RSI-based (default)
@@ -100,7 +121,7 @@ class StrategyMode(Enum):
     SNIPER = "sniper"  # High probability sniper
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeResult:
     """Hasil satu trade"""
     trade_number: int
@@ -114,18 +135,32 @@ class TradeResult:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStats:
     """Statistik trading session"""
     total_trades: int = 0
     wins: int = 0
     losses: int = 0
-    total_profit: float = 0.0
+    # Profit diakumulasi dalam sen (int) agar penjumlahan ribuan trade tetap eksak
+    total_profit_cents: int = 0
     starting_balance: float = 0.0
     current_balance: float = 0.0
     highest_balance: float = 0.0
     lowest_balance: float = 0.0
     
+    @property
+    def total_profit(self) -> float:
+        """Total profit session dalam USD"""
+        return self.total_profit_cents / 100.0
+    
+    @total_profit.setter
+    def total_profit(self, value: float) -> None:
+        self.total_profit_cents = _to_cents(value)
+    
+    def add_profit(self, profit: float) -> None:
+        """Tambahkan profit satu trade (konversi ke sen sekali)"""
+        self.total_profit_cents += _to_cents(profit)
+    
     @property
     def win_rate(self) -> float:
         """Hitung win rate dalam persentase"""
@@ -139,39 +174,73 @@ class SessionStats:
         return self.current_balance - self.starting_balance
 
 
+@dataclass(slots=True)
+class AnalyticsTrade:
+    """Satu trade di SessionAnalytics.trade_results"""
+    timestamp: datetime
+    is_win: bool
+    profit: float
+    stake: float
+    rsi: float
+
+
 class SessionAnalytics:
     """
     Performance analytics untuk tracking dan optimization.
     Tracks rolling win rate, hourly performance, dan martingale effectiveness.
     """
     
+    __slots__ = (
+        "trade_results", "_rolling_win_buf", "_rolling_wins",
+        "hourly_profits", "_last_hour_id", "_last_hour_key",
+        "martingale_recoveries", "martingale_failures",
+        "rsi_thresholds_performance", "_best_rsi_bucket",
+        "max_drawdown", "peak_balance",
+    )
+    
     ROLLING_WINDOW = 20
+    # Label bucket RSI "0-10" .. "90-100", dibuat sekali (bukan f-string per trade)
+    _RSI_BUCKET_LABELS = tuple(f"{i * 10}-{i * 10 + 10}" for i in range(10))
     
     def __init__(self):
         self.trade_results: deque = deque(maxlen=100)
-        self.hourly_profits: Dict[str, float] = {}
+        # Flag win (0/1) dari ROLLING_WINDOW trade terakhir + jumlahnya,
+        # supaya rolling win rate tidak perlu scan trade_results
+        self._rolling_win_buf: deque = deque(maxlen=self.ROLLING_WINDOW)
+        self._rolling_wins: int = 0
+        # Profit per jam dalam sen (int), dikonversi ke USD saat export
+        self.hourly_profits: Dict[str, int] = {}
+        # Key jam terakhir (y, m, d, h) + string-nya, strftime hanya saat jam berganti
+        self._last_hour_id: Optional[tuple] = None
+        self._last_hour_key: str = ""
         self.martingale_recoveries: int = 0
         self.martingale_failures: int = 0
         self.rsi_thresholds_performance: Dict[str, Dict] = {}
+        # Bucket dengan profit tertinggi, dijaga di add_trade(); None = perlu
+        # dihitung ulang (profit bucket terbaik turun atau ada seri)
+        self._best_rsi_bucket: Optional[str] = None
         self.max_drawdown: float = 0.0
         self.peak_balance: float = 0.0
         
     def add_trade(self, is_win: bool, profit: float, stake: float, 
                   rsi_value: float, current_balance: float):
         """Record trade result for analytics"""
-        hour = datetime.now().strftime("%Y-%m-%d %H:00")
+        now = datetime.now()
+        hour_id = (now.year, now.month, now.day, now.hour)
+        if hour_id != self._last_hour_id:
+            self._last_hour_id = hour_id
+            self._last_hour_key = now.strftime("%Y-%m-%d %H:00")
+        hour = self._last_hour_key
+        
+        self.trade_results.append(AnalyticsTrade(now, is_win, profit, stake, rsi_value))
         
-        self.trade_results.append({
-            "timestamp": datetime.now(),
-            "is_win": is_win,
-            "profit": profit,
-            "stake": stake,
-            "rsi": rsi_value
-        })
+        win_flag = 1 if is_win else 0
+        if len(self._rolling_win_buf) == self.ROLLING_WINDOW:
+            self._rolling_wins -= self._rolling_win_buf[0]
+        self._rolling_win_buf.append(win_flag)
+        self._rolling_wins += win_flag
         
-        if hour not in self.hourly_profits:
-            self.hourly_profits[hour] = 0.0
-        self.hourly_profits[hour] += profit
+        self.hourly_profits[hour] = self.hourly_profits.get(hour, 0) + _to_cents(profit)
         
         if current_balance > self.peak_balance:
             self.peak_balance = current_balance
@@ -180,15 +249,30 @@ class SessionAnalytics:
         if current_drawdown > self.max_drawdown:
             self.max_drawdown = current_drawdown
             
-        rsi_bucket = f"{int(rsi_value // 10) * 10}-{int(rsi_value // 10) * 10 + 10}"
-        if rsi_bucket not in self.rsi_thresholds_performance:
-            self.rsi_thresholds_performance[rsi_bucket] = {"wins": 0, "losses": 0, "profit": 0.0}
-        
-        if is_win:
-            self.rsi_thresholds_performance[rsi_bucket]["wins"] += 1
-        else:
-            self.rsi_thresholds_performance[rsi_bucket]["losses"] += 1
-        self.rsi_thresholds_performance[rsi_bucket]["profit"] += profit
+        # RSI 100 masuk bucket "90-100" (bukan bucket terpisah "100-110")
+        bucket_idx = int(rsi_value) // 10
+        bucket_idx = 9 if bucket_idx > 9 else (0 if bucket_idx < 0 else bucket_idx)
+        rsi_bucket = self._RSI_BUCKET_LABELS[bucket_idx]
+        bucket_stats = self.rsi_thresholds_performance.get(rsi_bucket)
+        if bucket_stats is None:
+            bucket_stats = {"wins": 0, "losses": 0, "profit": 0.0}
+            self.rsi_thresholds_performance[rsi_bucket] = bucket_stats
+        
+        bucket_stats["wins" if is_win else "losses"] += 1
+        bucket_stats["profit"] += profit
+        
+        best = self._best_rsi_bucket
+        if best is not None:
+            if rsi_bucket == best:
+                if profit < 0:
+                    self._best_rsi_bucket = None
+            else:
+                best_profit = self.rsi_thresholds_performance[best]["profit"]
+                if bucket_stats["profit"] > best_profit:
+                    self._best_rsi_bucket = rsi_bucket
+                elif bucket_stats["profit"] == best_profit:
+                    # Seri: max() memilih bucket yang lebih dulu masuk dict
+                    self._best_rsi_bucket = None
         
     def record_martingale_result(self, recovered: bool):
         """Track martingale recovery success"""
@@ -199,15 +283,11 @@ class SessionAnalytics:
             
     def get_rolling_win_rate(self) -> float:
         """Calculate rolling win rate over last N trades"""
-        if not self.trade_results:
-            return 50.0
-            
-        recent = list(self.trade_results)[-self.ROLLING_WINDOW:]
-        if not recent:
+        count = len(self._rolling_win_buf)
+        if not count:
             return 50.0
             
-        wins = sum(1 for t in recent if t["is_win"])
-        return (wins / len(recent)) * 100
+        return (self._rolling_wins / count) * 100
         
     def get_martingale_success_rate(self) -> float:
         """Calculate martingale recovery success rate"""
@@ -220,13 +300,13 @@ class SessionAnalytics:
         """Find RSI range with best performance"""
         if not self.rsi_thresholds_performance:
             return "N/A"
-            
-        best_range = max(
-            self.rsi_thresholds_performance.items(),
-            key=lambda x: x[1]["profit"],
-            default=(None, None)
-        )
-        return best_range[0] if best_range[0] else "N/A"
+        
+        if self._best_rsi_bucket is None:
+            self._best_rsi_bucket = max(
+                self.rsi_thresholds_performance.items(),
+                key=lambda x: x[1]["profit"]
+            )[0]
+        return self._best_rsi_bucket
         
     def get_summary(self) -> str:
         """Generate analytics summary"""
@@ -252,13 +332,18 @@ class SessionAnalytics:
             "peak_balance": self.peak_balance,
             "martingale_recoveries": self.martingale_recoveries,
             "martingale_failures": self.martingale_failures,
-            "hourly_profits": self.hourly_profits,
+            "hourly_profits": {hour: _from_cents(cents) for hour, cents in self.hourly_profits.items()},
             "rsi_performance": self.rsi_thresholds_performance,
             "trade_count": len(self.trade_results)
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        # Semua value sudah tipe JSON native (export_time sudah isoformat),
+        # jadi tanpa indent/default encoder C bisa dipakai penuh.
+        # Tulis ke .tmp lalu move, sama seperti session recovery file
+        temp_file = filepath + ".tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        shutil.move(temp_file, filepath)
         logger.info(f"📊 Analytics exported to {filepath}")
 
 
@@ -284,6 +369,7 @@ class TradingManager:
     MAX_BUY_RETRY = 5
     MAX_DAILY_LOSS = 50.0
     SIGNAL_PROCESSING_TIMEOUT = 120.0
+    MAX_TRADE_HISTORY = 10_000  # Batas trade_history; entry tertua dibuang otomatis
     
     RETRY_BASE_DELAY = 5.0
     RETRY_MAX_DELAY = 60.0
@@ -305,6 +391,14 @@ class TradingManager:
     SESSION_RECOVERY_MAX_AGE = 1800  # restore jika bot restart dalam 30 menit (1800 detik)
     SESSION_RECOVERY_FILE = "logs/session_recovery.json"
     
+    # Journal batching: row ditulis per batch (maks JOURNAL_BATCH_SIZE row atau
+    # setelah menunggu JOURNAL_FLUSH_SECS sejak row pertama di batch)
+    JOURNAL_BATCH_SIZE = 20
+    JOURNAL_FLUSH_SECS = 2.0
+    
+    # Progress notification milestones (%), terurut naik untuk bisect di _on_tick
+    PROGRESS_MILESTONES = (0, 25, 50, 75, 100)
+    
     def __init__(self, deriv_ws: DerivWebSocket, strategy_type: str = "multi_indicator"):
         """
         Inisialisasi Trading Manager.
@@ -341,17 +435,39 @@ class TradingManager:
         
         # ANTI-DOUBLE BUY: Flag dan Lock untuk mencegah eksekusi concurrent
         self.is_processing_signal: bool = False
-        self._signal_lock = threading.RLock()  # Thread-safe reentrant lock untuk signal processing
+        # Tick/buy callbacks datang dari thread websocket (DerivWebSocket.ws_thread),
+        # bukan event loop asyncio, jadi tetap butuh lock antar-thread. Lock biasa
+        # cukup: hanya di-acquire non-blocking di _check_and_execute_signal() dan
+        # tidak pernah nested, sehingga re-entrancy RLock tidak diperlukan
+        self._signal_lock = threading.Lock()
         self.last_trade_time: float = 0.0
         self.buy_retry_count: int = 0
+        # Monotonic deadline backoff retry buy; tick diabaikan sampai waktu ini
+        self.buy_retry_until: float = 0.0
+        # Delay backoff per percobaan retry, dihitung sekali (tanpa pow tiap kegagalan)
+        self._retry_delays: Tuple[float, ...] = tuple(
+            min(self.RETRY_BASE_DELAY * (2 ** i), self.RETRY_MAX_DELAY)
+            for i in range(self.MAX_BUY_RETRY)
+        )
         self.signal_processing_start_time: float = 0.0  # Untuk timeout detection
         
         # Buy timeout tracking (Task 1)
         self.buy_request_time: float = 0.0  # timestamp saat buy request dikirim
         self._buy_timeout_task: Optional[asyncio.Task] = None
         
+        # Journal CSV ditulis oleh thread writer terpisah (copy file + fsync
+        # tidak memblok callback websocket); item antrian: (journal_file, row),
+        # atau None sebagai permintaan flush segera dari _flush_journal()
+        self._journal_queue: queue.Queue = queue.Queue()
+        self._journal_thread: Optional[threading.Thread] = None
+        # Cache per file journal (hanya diakses thread writer): jumlah record,
+        # file yang sudah divalidasi, dan kelipatan max_records terakhir yang di-backup
+        self._journal_record_count: Dict[str, int] = {}
+        self._journal_validated: set = set()
+        self._journal_backup_level: Dict[str, int] = {}
+        
         # Circuit breaker tracking (Task 1)
-        self.buy_failure_times: List[float] = []  # timestamps of recent buy failures
+        self.buy_failure_times: deque = deque()  # timestamps of recent buy failures (monotonic, terurut)
         self.circuit_breaker_active: bool = False
         self.circuit_breaker_end_time: float = 0.0
         
@@ -369,18 +485,21 @@ class TradingManager:
         self.last_progress_notification_time: float = 0.0
         self.last_notified_milestone: int = -1  # Track last milestone to avoid duplicate
         self.sent_milestones: set = set()  # Track ALL milestones sent in this session
-        self.PROGRESS_MILESTONES = [0, 25, 50, 75, 100]  # More milestones for real-time feel
+        self._progress_done: bool = False  # True setelah milestone 100% terkirim
         self.MIN_PROGRESS_NOTIFICATION_INTERVAL = 3.0  # 3 seconds debounce for faster updates
         
         # Statistics
         self.stats = SessionStats()
-        self.trade_history: list[TradeResult] = []
+        self.trade_history: deque[TradeResult] = deque(maxlen=self.MAX_TRADE_HISTORY)
         self.analytics = SessionAnalytics()
         
         # Recovery Martingale tracking (simplified 2.1x multiplier)
         self.martingale_level: int = 0
         self.in_martingale_sequence: bool = False
         self.cumulative_loss: float = 0.0  # Track total losses in current sequence for recovery logging
+        # Tangga stake martingale per level (index = martingale_level), dihitung
+        # sekali per sequence oleh _build_martingale_ladder()
+        self._martingale_ladder: Tuple[float, ...] = ()
         
         # Strategy mode
         self.strategy_mode: StrategyMode = StrategyMode.MULTI_INDICATOR
@@ -401,6 +520,17 @@ class TradingManager:
         self.on_error: Optional[Callable] = None
         self.on_progress: Optional[Callable] = None
         
+        # Callback di atas melakukan HTTP blocking (kirim Telegram), jadi
+        # dijalankan berurutan (FIFO) di thread notifier lewat _notify(),
+        # bukan di thread websocket yang memproses tick
+        self._notify_queue: queue.Queue = queue.Queue()
+        self._notify_thread: Optional[threading.Thread] = None
+        
+        # Penulisan file session (recovery JSON, summary) dikerjakan thread IO
+        # lewat _submit_io(); data di-snapshot dulu di thread pemanggil
+        self._io_queue: queue.Queue = queue.Queue()
+        self._io_thread: Optional[threading.Thread] = None
+        
         # Stop requested flag - defers session reset until pending trade settles
         self.stop_requested: bool = False
         
@@ -433,8 +563,6 @@ class TradingManager:
         Returns:
             True jika preload berhasil, False jika gagal
         """
-        import time as time_module
-        
         # Untuk strategi digit-based, butuh lebih banyak tick (min 50)
         min_ticks_for_digit = 60  # Extra buffer untuk digit analysis
         required_ticks = max(self.required_ticks + 30, min_ticks_for_digit)
@@ -449,11 +577,14 @@ class TradingManager:
             )
             
             if prices and len(prices) >= self.required_ticks:
-                for price in prices:
-                    price_float = float(price)
-                    # Add tick to main strategy
-                    self.strategy.add_tick(price_float)
-                    
+                price_floats = [float(price) for price in prices]
+                
+                # Main strategy dan Terminal Strategy menerima seluruh history sekaligus
+                self.strategy.add_ticks(price_floats)
+                if self.terminal_strategy:
+                    self.terminal_strategy.add_ticks(price_floats)
+                
+                for price_float in price_floats:
                     # Add tick to LDP strategy if active (for DIGITPAD and LDP modes)
                     if self.ldp_strategy:
                         self.ldp_strategy.add_tick(price_float)
@@ -462,10 +593,6 @@ class TradingManager:
                     if self.tick_analyzer:
                         self.tick_analyzer.add_tick(price_float)
                     
-                    # Add tick to Terminal Strategy if active
-                    if self.terminal_strategy:
-                        self.terminal_strategy.add_tick(price_float)
-                    
                     # Add tick to Accumulator Strategy if active
                     if self.accumulator_strategy:
                         self.accumulator_strategy.add_tick(price_float)
@@ -490,6 +617,31 @@ class TradingManager:
         """
         return self.MARTINGALE_MULTIPLIER
     
+    def _build_martingale_ladder(self, stake: float, level: int) -> Tuple[float, ...]:
+        """
+        Hitung stake untuk level martingale level..MAX_MARTINGALE_LEVEL, mulai dari
+        stake di level tersebut. Pembulatan per level sama seperti perhitungan berantai
+        round(stake * multiplier, 2). Index < level diisi 0.0 (tidak dipakai).
+        """
+        multiplier = self._get_martingale_multiplier()
+        ladder = [0.0] * level + [stake]
+        for _ in range(level, self.MAX_MARTINGALE_LEVEL):
+            ladder.append(round(ladder[-1] * multiplier, 2))
+        return tuple(ladder)
+    
+    def _next_martingale_stake(self) -> float:
+        """
+        Stake untuk martingale_level saat ini (dipanggil setelah level dinaikkan).
+        Ladder dibangun ulang hanya jika stake level sebelumnya tidak cocok
+        (sequence baru, stake disesuaikan ke minimum, atau session di-restore).
+        """
+        level = self.martingale_level
+        ladder = self._martingale_ladder
+        if level >= len(ladder) or ladder[level - 1] != self.current_stake:
+            ladder = self._build_martingale_ladder(self.current_stake, level - 1)
+            self._martingale_ladder = ladder
+        return ladder[level]
+    
     def set_strategy_mode(self, mode: StrategyMode) -> str:
         """Switch strategy mode and broadcast to dashboard"""
         self.strategy_mode = mode
@@ -766,10 +918,9 @@ class TradingManager:
         Handler untuk setiap tick yang masuk.
         Menambahkan ke strategy dan mengecek signal.
         """
-        import time as time_module
-        
         # Tambahkan tick ke semua strategi aktif
-        self.strategy.add_tick(price)
+        strategy = self.strategy
+        strategy.add_tick(price)
         
         # Add tick to LDP strategy if it exists
         if self.ldp_strategy:
@@ -793,97 +944,144 @@ class TradingManager:
                 logger.info("🔄 Buy timeout handled, continuing to next tick")
                 return
         
+        # State dibaca setelah _check_buy_timeout() karena method itu bisa mengubahnya
+        state = self.state
+        
         # EDGE CASE: Handle stop requested but trade might have been cleared by other means
         # If state is STOPPED and stop_requested is True but no pending contract, finalize now
-        if self.state == TradingState.STOPPED and self.stop_requested and not self.current_contract_id:
+        if state == TradingState.STOPPED and self.stop_requested and not self.current_contract_id:
             logger.info("🔄 Edge case detected: stop_requested but no pending contract. Finalizing stop...")
             summary = self._finalize_stop()
             # Notify user with session summary (pushed via callback)
             if summary and self.on_session_complete:
-                self.on_session_complete(summary)
+                self._notify(self.on_session_complete, summary)
             return
         
         # Jika sedang dalam posisi, tidak perlu analisis
-        if self.state == TradingState.WAITING_RESULT:
+        if state == TradingState.WAITING_RESULT:
             return
             
         # ANTI-DOUBLE BUY: Jika sedang processing signal, check timeout
-        current_time = time_module.time()
+        current_time = monotonic()
         if self.is_processing_signal:
-            if self.signal_processing_start_time > 0:
-                elapsed = current_time - self.signal_processing_start_time
+            processing_start_time = self.signal_processing_start_time
+            if processing_start_time > 0:
+                elapsed = current_time - processing_start_time
                 if elapsed > self.SIGNAL_PROCESSING_TIMEOUT:
                     logger.warning(f"⚠️ Signal processing timeout after {elapsed:.1f}s. Resetting flags.")
                     self._log_error(f"Signal processing timeout after {elapsed:.1f}s")
                     self._reset_processing_state()
                 else:
-                    logger.debug(f"Skipping tick - signal processing ({elapsed:.1f}s/{self.SIGNAL_PROCESSING_TIMEOUT}s)")
+                    logger.debug("Skipping tick - signal processing (%.1fs/%ss)", elapsed, self.SIGNAL_PROCESSING_TIMEOUT)
                     return
             else:
                 logger.debug("Skipping tick - signal still being processed")
                 return
             
+        # RETRY BACKOFF: Tunggu backoff setelah buy gagal tanpa memblokir thread websocket
+        if current_time < self.buy_retry_until:
+            logger.debug("Retry backoff active: %.1fs remaining", self.buy_retry_until - current_time)
+            return
+            
         # COOLDOWN CHECK: Cek apakah sudah melewati cooldown time
-        if self.last_trade_time > 0:
-            time_since_last_trade = current_time - self.last_trade_time
+        last_trade_time = self.last_trade_time
+        if last_trade_time > 0:
+            time_since_last_trade = current_time - last_trade_time
             if time_since_last_trade < self.TRADE_COOLDOWN_SECONDS:
-                logger.debug(f"Cooldown active: {self.TRADE_COOLDOWN_SECONDS - time_since_last_trade:.1f}s remaining")
+                logger.debug("Cooldown active: %.1fs remaining", self.TRADE_COOLDOWN_SECONDS - time_since_last_trade)
                 return
             
         # Jika auto trading aktif, analisis signal
-        if self.state == TradingState.RUNNING:
+        if state == TradingState.RUNNING:
             self.tick_count += 1
             
-            stats = self.strategy.get_stats()
-            current_tick_count = stats['tick_count']
-            
-            # Task 7: Progress notification optimization - milestone-based with time debouncing
-            # Only notify at milestones (0%, 50%, 100%) with 30s debounce between notifications
-            if current_tick_count <= self.required_ticks:
-                progress_pct = int((current_tick_count / self.required_ticks) * 100)
-                
-                # Find the current milestone (0, 50, 100)
-                current_milestone = 0
-                for milestone in self.PROGRESS_MILESTONES:
-                    if progress_pct >= milestone:
-                        current_milestone = milestone
+            # Setelah milestone 100% terkirim tidak ada notifikasi lain yang mungkin,
+            # jadi perhitungan progress dilewati sepenuhnya
+            if not self._progress_done:
+                current_tick_count = strategy.tick_count
+                required_ticks = self.required_ticks
                 
-                # Get indicator values for milestone notification
-                rsi_value = stats['rsi'] if current_tick_count >= 15 else 0
-                trend = stats['trend']
-                
-                # Check if we should send notification:
-                # 1. Must be a new milestone (not sent before in this session)
-                # 2. Must pass time debounce interval (30 seconds)
-                # 3. First notification always allowed
-                time_since_last_notification = current_time - self.last_progress_notification_time
-                is_new_milestone = current_milestone > self.last_notified_milestone
-                is_milestone_not_sent = current_milestone not in self.sent_milestones
-                is_past_min_interval = time_since_last_notification >= self.MIN_PROGRESS_NOTIFICATION_INTERVAL
-                is_first_notification = self.last_progress_notification_time == 0.0
-                
-                should_notify = (
-                    is_new_milestone and 
-                    is_milestone_not_sent and
-                    (is_first_notification or is_past_min_interval)
-                )
-                
-                if should_notify:
-                    # Only log when milestone is reached
-                    logger.info(f"📊 Milestone {current_milestone}% reached: {current_tick_count}/{self.required_ticks} ticks | RSI: {rsi_value} | Trend: {trend}")
+                # Task 7: Progress notification optimization - milestone-based with time debouncing
+                # Only notify at milestones (0%, 50%, 100%) with 30s debounce between notifications
+                if current_tick_count <= required_ticks:
+                    progress_pct = int((current_tick_count / required_ticks) * 100)
+                    
+                    # Find the current milestone - milestone terbesar yang <= progress_pct
+                    milestones = self.PROGRESS_MILESTONES
+                    current_milestone = milestones[bisect_right(milestones, progress_pct) - 1]
                     
-                    if self.on_progress:
-                        try:
-                            self.on_progress(current_tick_count, self.required_ticks, rsi_value, trend)
-                            self.last_progress_notification_time = current_time
-                            self.last_notified_milestone = current_milestone
-                            self.sent_milestones.add(current_milestone)  # Track sent milestone
-                            logger.debug(f"✅ Progress notification sent for milestone {current_milestone}%")
-                        except Exception as e:
-                            logger.error(f"❌ Error calling on_progress callback: {type(e).__name__}: {e}")
+                    # Check if we should send notification:
+                    # 1. Must be a new milestone (not sent before in this session)
+                    # 2. Must pass time debounce interval (30 seconds)
+                    # 3. First notification always allowed
+                    time_since_last_notification = current_time - self.last_progress_notification_time
+                    is_new_milestone = current_milestone > self.last_notified_milestone
+                    is_milestone_not_sent = current_milestone not in self.sent_milestones
+                    is_past_min_interval = time_since_last_notification >= self.MIN_PROGRESS_NOTIFICATION_INTERVAL
+                    is_first_notification = self.last_progress_notification_time == 0.0
+                    
+                    should_notify = (
+                        is_new_milestone and 
+                        is_milestone_not_sent and
+                        (is_first_notification or is_past_min_interval)
+                    )
+                    
+                    if should_notify:
+                        # Get indicator values for milestone notification
+                        rsi_value = strategy.current_rsi if current_tick_count >= 15 else 0
+                        trend = strategy.current_trend
+                        
+                        # Only log when milestone is reached
+                        logger.info(f"📊 Milestone {current_milestone}% reached: {current_tick_count}/{required_ticks} ticks | RSI: {rsi_value} | Trend: {trend}")
+                        
+                        if self.on_progress:
+                            try:
+                                self._notify(self.on_progress, current_tick_count, required_ticks, rsi_value, trend)
+                                self.last_progress_notification_time = current_time
+                                self.last_notified_milestone = current_milestone
+                                self.sent_milestones.add(current_milestone)  # Track sent milestone
+                                if current_milestone == 100:
+                                    self._progress_done = True
+                                logger.debug("✅ Progress notification sent for milestone %d%%", current_milestone)
+                            except Exception as e:
+                                logger.error(f"❌ Error calling on_progress callback: {type(e).__name__}: {e}")
             
             self._check_and_execute_signal()
             
+    def _notify(self, callback: Callable, *args) -> None:
+        """Jadwalkan callback notifikasi di thread notifier (urutan tetap FIFO)"""
+        if self._notify_thread is None or not self._notify_thread.is_alive():
+            self._notify_thread = threading.Thread(
+                target=self._notify_loop,
+                name="notifier",
+                daemon=True
+            )
+            self._notify_thread.start()
+        self._notify_queue.put((callback, args))
+    
+    def _notify_loop(self):
+        """Thread notifier: jalankan callback yang antri satu per satu"""
+        while True:
+            callback, args = self._notify_queue.get()
+            try:
+                callback(*args)
+            except Exception as e:
+                name = getattr(callback, "__name__", repr(callback))
+                logger.error(f"❌ Error in notification callback {name}: {type(e).__name__}: {e}")
+    
+    def flush_notifications(self, timeout: float = 10.0) -> bool:
+        """
+        Tunggu sampai notifikasi yang sudah antri selesai dikirim.
+        
+        Returns:
+            True jika antrian selesai sebelum timeout
+        """
+        if self._notify_thread is None or not self._notify_thread.is_alive():
+            return True
+        done = threading.Event()
+        self._notify_queue.put((done.set, ()))
+        return done.wait(timeout)
+    
     def _check_circuit_breaker(self) -> bool:
         """
         Check apakah circuit breaker aktif.
@@ -892,13 +1090,14 @@ class TradingManager:
         Task 1: Circuit breaker jika 3 consecutive buy failures dalam 1 menit.
         Fixed: Prune old entries sebelum check untuk rolling window yang benar.
         """
-        import time as time_module
-        current_time = time_module.time()
+        current_time = monotonic()
         
         # Prune old failure entries terlebih dahulu (rolling 60s window)
-        if self.buy_failure_times:
+        failure_times = self.buy_failure_times
+        if failure_times:
             window_start = current_time - self.CIRCUIT_BREAKER_WINDOW
-            self.buy_failure_times = [t for t in self.buy_failure_times if t >= window_start]
+            while failure_times and failure_times[0] < window_start:
+                failure_times.popleft()
         
         # Cek apakah masih dalam cooldown period
         if self.circuit_breaker_active:
@@ -919,17 +1118,19 @@ class TradingManager:
         Record buy failure untuk circuit breaker tracking.
         Trigger circuit breaker jika 3 failures dalam 1 menit.
         """
-        import time as time_module
-        current_time = time_module.time()
+        current_time = monotonic()
         
         # Tambahkan failure time
-        self.buy_failure_times.append(current_time)
+        failure_times = self.buy_failure_times
+        failure_times.append(current_time)
         
-        # Remove old failures di luar window
+        # Remove old failures di luar window - timestamp monotonic sudah
+        # terurut, jadi cukup buang dari depan
         window_start = current_time - self.CIRCUIT_BREAKER_WINDOW
-        self.buy_failure_times = [t for t in self.buy_failure_times if t >= window_start]
+        while failure_times[0] < window_start:
+            failure_times.popleft()
         
-        logger.debug(f"Buy failures in window: {len(self.buy_failure_times)}/{self.CIRCUIT_BREAKER_FAILURES}")
+        logger.debug("Buy failures in window: %d/%d", len(failure_times), self.CIRCUIT_BREAKER_FAILURES)
         
         # Cek apakah perlu trigger circuit breaker
         if len(self.buy_failure_times) >= self.CIRCUIT_BREAKER_FAILURES:
@@ -941,14 +1142,15 @@ class TradingManager:
             self.circuit_breaker_end_time = current_time + self.CIRCUIT_BREAKER_COOLDOWN
             
             if self.on_error:
-                self.on_error(
+                self._notify(
+                    self.on_error,
                     f"Circuit breaker aktif! {len(self.buy_failure_times)}x buy gagal dalam 1 menit. "
                     f"Trading pause {int(self.CIRCUIT_BREAKER_COOLDOWN)}s."
                 )
             
             self._log_error(
                 f"Circuit breaker triggered: {len(self.buy_failure_times)} failures, "
-                f"cooldown until {datetime.fromtimestamp(self.circuit_breaker_end_time).strftime('%H:%M:%S')}"
+                f"cooldown until {(datetime.now() + timedelta(seconds=self.CIRCUIT_BREAKER_COOLDOWN)).strftime('%H:%M:%S')}"
             )
             return True
         
@@ -959,12 +1161,10 @@ class TradingManager:
         Check apakah buy request sudah timeout (30 detik).
         Task 1: Auto-reset state ke RUNNING jika timeout tercapai.
         """
-        import time as time_module
-        
         if self.buy_request_time <= 0:
             return False
             
-        current_time = time_module.time()
+        current_time = monotonic()
         elapsed = current_time - self.buy_request_time
         
         if elapsed >= self.BUY_RESPONSE_TIMEOUT:
@@ -982,7 +1182,7 @@ class TradingManager:
             self.state = TradingState.RUNNING
             
             if self.on_error:
-                self.on_error(f"Buy timeout setelah {int(elapsed)}s. Auto-reset state.")
+                self._notify(self.on_error, f"Buy timeout setelah {int(elapsed)}s. Auto-reset state.")
             
             logger.info("🔄 State auto-reset ke RUNNING setelah buy timeout")
             return True
@@ -998,8 +1198,6 @@ class TradingManager:
         - Circuit breaker tracking
         - Buy timeout reset
         """
-        import time as time_module
-        
         # Reset buy request time karena sudah dapat response
         self.buy_request_time = 0.0
         
@@ -1032,31 +1230,31 @@ class TradingManager:
             if self.buy_retry_count >= self.MAX_BUY_RETRY:
                 # Max retry tercapai, stop trading
                 if self.on_error:
-                    self.on_error(f"Trading dihentikan setelah {self.MAX_BUY_RETRY}x gagal. Error: {error_msg}")
+                    self._notify(self.on_error, f"Trading dihentikan setelah {self.MAX_BUY_RETRY}x gagal. Error: {error_msg}")
                 self.state = TradingState.STOPPED
                 self.buy_retry_count = 0
                 logger.error(f"❌ Max buy retry reached ({self.MAX_BUY_RETRY}x). Trading stopped.")
                 return
             
             if self.on_error:
-                self.on_error(f"Gagal open posisi (retry {self.buy_retry_count}/{self.MAX_BUY_RETRY}): {error_msg}")
+                self._notify(self.on_error, f"Gagal open posisi (retry {self.buy_retry_count}/{self.MAX_BUY_RETRY}): {error_msg}")
             
             # Exponential backoff delay with jitter
-            import random
-            base_delay = self.RETRY_BASE_DELAY * (2 ** (self.buy_retry_count - 1))
-            delay = min(base_delay, self.RETRY_MAX_DELAY)
-            jitter = random.uniform(0, delay * 0.3)
-            final_delay = delay + jitter
+            # Tidak memakai time.sleep(): callback ini berjalan di thread websocket,
+            # jadi sleep akan menahan semua tick/response. Deadline dicek di _on_tick
+            delay = self._retry_delays[self.buy_retry_count - 1]
+            final_delay = delay + random.uniform(0, delay * 0.3)
+            self.buy_retry_until = monotonic() + final_delay
             
-            logger.info(f"⏳ Exponential backoff: waiting {final_delay:.1f}s before retry (base: {base_delay:.1f}s)...")
-            time_module.sleep(final_delay)
+            logger.info(f"⏳ Exponential backoff: waiting {final_delay:.1f}s before retry (base: {delay:.1f}s)...")
             
-            # Reset state untuk coba lagi
+            # Reset state untuk coba lagi (tick di-skip sampai backoff selesai)
             self.state = TradingState.RUNNING
             return
         
         # SUCCESS: Reset counters
         self.buy_retry_count = 0
+        self.buy_retry_until = 0.0
         self.buy_failure_times.clear()  # Reset failure tracking on success
         
         buy_info = data.get("buy", {})
@@ -1064,7 +1262,7 @@ class TradingManager:
         self.entry_price = float(buy_info.get("buy_price", 0))
         
         # Update last trade time untuk cooldown
-        self.last_trade_time = time_module.time()
+        self.last_trade_time = monotonic()
         
         # Subscribe ke contract updates
         if self.current_contract_id:
@@ -1074,7 +1272,8 @@ class TradingManager:
         
         # Notify via callback
         if self.on_trade_opened:
-            self.on_trade_opened(
+            self._notify(
+                self.on_trade_opened,
                 self.current_trade_type or "UNKNOWN",
                 self.strategy.get_current_price() or 0,
                 self.current_stake,
@@ -1145,7 +1344,7 @@ class TradingManager:
             self.stats.losses += 1
             self.consecutive_losses += 1  # Increment consecutive losses
             self.daily_loss += abs(profit)  # Track daily loss
-        self.stats.total_profit += profit
+        self.stats.add_profit(profit)
         
         # Simpan stake yang BENAR-BENAR digunakan untuk trade ini SEBELUM Martingale mengubahnya
         actual_trade_stake = self.current_stake
@@ -1164,7 +1363,8 @@ class TradingManager:
         self.trade_history.append(result)
         
         # Track analytics
-        rsi_value = self.strategy.last_indicators.rsi if hasattr(self.strategy, 'last_indicators') else 50.0
+        indicators = getattr(self.strategy, 'last_indicators', None)
+        rsi_value = indicators.rsi if indicators is not None else 50.0
         self.analytics.add_trade(
             is_win=is_win,
             profit=profit,
@@ -1180,7 +1380,7 @@ class TradingManager:
         if self.consecutive_losses >= self.MAX_CONSECUTIVE_LOSSES:
             logger.warning(f"⚠️ Max consecutive losses reached: {self.consecutive_losses}")
             if self.on_error:
-                self.on_error(f"Trading dihentikan! {self.consecutive_losses}x loss berturut-turut.")
+                self._notify(self.on_error, f"Trading dihentikan! {self.consecutive_losses}x loss berturut-turut.")
             self.is_processing_signal = False
             self.signal_processing_start_time = 0.0
             self._complete_session()
@@ -1195,7 +1395,7 @@ class TradingManager:
                 recovered_amount = self.cumulative_loss
                 logger.info(f"🎉 RECOVERY SUCCESSFUL! Recovered ${recovered_amount:.2f} losses after {self.martingale_level} levels")
                 if self.on_error:
-                    self.on_error(f"🎉 Recovery successful! Recovered ${recovered_amount:.2f} losses after {self.martingale_level} levels")
+                    self._notify(self.on_error, f"🎉 Recovery successful! Recovered ${recovered_amount:.2f} losses after {self.martingale_level} levels")
             
             self.current_stake = self.base_stake
             self.martingale_level = 0
@@ -1211,7 +1411,8 @@ class TradingManager:
                 logger.error(f"   Total loss in sequence: ${self.cumulative_loss:.2f}")
                 self.analytics.record_martingale_result(recovered=False)
                 if self.on_error:
-                    self.on_error(
+                    self._notify(
+                        self.on_error,
                         f"❌ MAX MARTINGALE LEVEL {self.MAX_MARTINGALE_LEVEL} REACHED!\n"
                         f"Total loss: ${self.cumulative_loss:.2f}\n"
                         f"Trading STOPPED untuk mencegah kerugian lebih besar."
@@ -1235,14 +1436,13 @@ class TradingManager:
                 else:
                     # BALANCE GUARD: Get current balance BEFORE calculating next stake
                     current_balance = self.ws.get_balance()
-                    multiplier = self._get_martingale_multiplier()
-                    next_stake = round(self.current_stake * multiplier, 2)
+                    next_stake = self._next_martingale_stake()
                     
                     # Pre-check: Ensure next stake doesn't exceed balance
                     if next_stake > current_balance:
                         logger.warning(f"⚠️ Martingale stake ${next_stake:.2f} melebihi balance ${current_balance:.2f}")
                         if self.on_error:
-                            self.on_error(f"Trading dihentikan! Balance tidak cukup untuk Martingale (${next_stake:.2f} > ${current_balance:.2f})")
+                            self._notify(self.on_error, f"Trading dihentikan! Balance tidak cukup untuk Martingale (${next_stake:.2f} > ${current_balance:.2f})")
                         self.analytics.record_martingale_result(recovered=False)
                         self.is_processing_signal = False
                         self.signal_processing_start_time = 0.0
@@ -1252,13 +1452,14 @@ class TradingManager:
                     self.current_stake = next_stake
                     logger.info(
                         f"📊 MARTINGALE Level {self.martingale_level}/{self.MAX_MARTINGALE_LEVEL}: "
-                        f"stake ${next_stake:.2f} (x{multiplier}) | "
+                        f"stake ${next_stake:.2f} (x{self._get_martingale_multiplier()}) | "
                         f"Cumulative Loss: ${self.cumulative_loss:.2f}"
                     )
             
         # Notify via callback
         if self.on_trade_closed:
-            self.on_trade_closed(
+            self._notify(
+                self.on_trade_closed,
                 is_win,
                 profit,
                 self.stats.current_balance,
@@ -1311,7 +1512,7 @@ class TradingManager:
                 summary = self._finalize_stop()
                 # Notify user with session summary (pushed via callback)
                 if self.on_session_complete:
-                    self.on_session_complete(summary)
+                    self._notify(self.on_session_complete, summary)
         else:
             # Reset state untuk trade berikutnya
             self.state = TradingState.RUNNING
@@ -1352,6 +1553,9 @@ class TradingManager:
         # Task 5: Clear session recovery file setelah session selesai normal
         self._clear_session_recovery()
         
+        # Pastikan semua trade sudah tertulis di journal sebelum session ditutup
+        self._flush_journal()
+        
         # Save session summary to file
         self._save_session_summary()
         
@@ -1373,15 +1577,16 @@ class TradingManager:
         
         if self.on_session_complete:
             try:
-                logger.info(f"📞 Calling on_session_complete callback...")
-                self.on_session_complete(
+                logger.info(f"📞 Queueing on_session_complete callback...")
+                self._notify(
+                    self.on_session_complete,
                     self.stats.total_trades,
                     self.stats.wins,
                     self.stats.losses,
                     self.stats.total_profit,
                     self.stats.win_rate
                 )
-                logger.info(f"📞 on_session_complete callback completed successfully")
+                logger.info(f"📞 on_session_complete callback queued")
             except Exception as e:
                 logger.error(f"❌ Error calling on_session_complete: {type(e).__name__}: {e}")
                 import traceback
@@ -1410,19 +1615,49 @@ class TradingManager:
         except Exception as e:
             logger.error(f"Failed to write error log: {e}")
     
+    def _submit_io(self, job: Callable, *args) -> None:
+        """Jadwalkan penulisan file di thread IO (urutan tetap FIFO)"""
+        if self._io_thread is None or not self._io_thread.is_alive():
+            self._io_thread = threading.Thread(
+                target=self._io_loop,
+                name="session-io",
+                daemon=True
+            )
+            self._io_thread.start()
+        self._io_queue.put((job, args))
+    
+    def _io_loop(self):
+        """Thread IO: jalankan job penulisan file yang antri satu per satu"""
+        while True:
+            job, args = self._io_queue.get()
+            try:
+                job(*args)
+            except Exception as e:
+                name = getattr(job, "__name__", repr(job))
+                logger.error(f"❌ Error in session IO job {name}: {type(e).__name__}: {e}")
+            finally:
+                self._io_queue.task_done()
+    
+    def _flush_io(self):
+        """Tunggu sampai semua job penulisan file yang antri selesai"""
+        if self._io_thread is not None and self._io_thread.is_alive():
+            self._io_queue.join()
+    
     def _save_session_recovery(self):
         """
         Auto-save session stats ke JSON file untuk recovery.
         Task 5: Session Recovery Mechanism.
         Dipanggil setiap SESSION_SAVE_INTERVAL trades.
+        
+        Data di-snapshot di sini, penulisan file dikerjakan thread IO
+        (lihat _write_session_recovery) supaya _process_trade_result tidak menunggu disk.
         """
         if not self.session_recovery_enabled:
             return
             
         try:
-            import time as time_module
             recovery_data = {
-                "save_timestamp": time_module.time(),
+                "save_timestamp": time.time(),
                 "save_datetime": datetime.now().isoformat(),
                 "symbol": self.symbol,
                 "base_stake": self.base_stake,
@@ -1447,18 +1682,30 @@ class TradingManager:
                 "session_start_date": self.session_start_date
             }
             
+            self._submit_io(self._write_session_recovery, recovery_data)
+                       
+        except Exception as e:
+            logger.error(f"Failed to save session recovery: {e}")
+            self._log_error(f"Session recovery save failed: {e}")
+    
+    def _write_session_recovery(self, recovery_data: Dict[str, Any]):
+        """Tulis snapshot session recovery ke JSON (atomic: temp file + rename)"""
+        try:
             recovery_file = self.SESSION_RECOVERY_FILE
             
             os.makedirs(os.path.dirname(recovery_file), exist_ok=True)
             
+            # JSON compact (tanpa indent) supaya encoder C yang dipakai; file
+            # tetap JSON agar recovery file versi lama masih bisa dibaca
             temp_file = recovery_file + ".tmp"
             with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(recovery_data, f, indent=2, default=str)
+                json.dump(recovery_data, f, separators=(',', ':'), default=str)
             
             shutil.move(temp_file, recovery_file)
             
-            logger.info(f"💾 Session recovery saved: {self.stats.total_trades} trades, "
-                       f"profit: ${self.stats.total_profit:.2f}")
+            stats = recovery_data["stats"]
+            logger.info(f"💾 Session recovery saved: {stats['total_trades']} trades, "
+                       f"profit: ${stats['total_profit']:.2f}")
                        
         except Exception as e:
             logger.error(f"Failed to save session recovery: {e}")
@@ -1483,13 +1730,11 @@ class TradingManager:
             return False
             
         try:
-            import time as time_module
-            
             with open(recovery_file, 'r', encoding='utf-8') as f:
                 recovery_data = json.load(f)
             
             save_timestamp = recovery_data.get("save_timestamp", 0)
-            current_time = time_module.time()
+            current_time = time.time()
             age_seconds = current_time - save_timestamp
             
             if age_seconds > self.SESSION_RECOVERY_MAX_AGE:
@@ -1569,6 +1814,8 @@ class TradingManager:
         Clear recovery file setelah session selesai normal.
         Task 5: Session Recovery Mechanism.
         """
+        # Save yang masih antri harus selesai dulu, kalau tidak file dibuat ulang
+        self._flush_io()
         try:
             recovery_file = self.SESSION_RECOVERY_FILE
             if os.path.exists(recovery_file):
@@ -1593,20 +1840,15 @@ class TradingManager:
                 reader = csv.reader(f)
                 header = next(reader, None)
                 
-                expected_header = [
-                    "timestamp", "trade_number", "symbol", "type", 
-                    "entry_price", "exit_price", "stake", "payout", 
-                    "profit", "is_win", "rsi", "trend"
-                ]
-                
-                if header != expected_header:
-                    logger.warning(f"⚠️ CSV header mismatch. Expected: {expected_header}, Got: {header}")
+                if header is None or tuple(header) != EXPECTED_JOURNAL_HEADER:
+                    logger.warning(f"⚠️ CSV header mismatch. Expected: {list(EXPECTED_JOURNAL_HEADER)}, Got: {header}")
                     return False
                 
-                # Count records untuk validation
+                # Count records untuk validation (di-cache, update incremental saat append)
                 record_count = sum(1 for _ in reader)
-                logger.debug(f"CSV validation: {record_count} records found")
+                logger.debug("CSV validation: %d records found", record_count)
                 
+            self._journal_record_count[filepath] = record_count
             return True
         except Exception as e:
             logger.error(f"CSV validation error: {e}")
@@ -1617,12 +1859,6 @@ class TradingManager:
         Auto-repair header jika missing.
         Task 9: CSV validation.
         """
-        expected_header = [
-            "timestamp", "trade_number", "symbol", "type", 
-            "entry_price", "exit_price", "stake", "payout", 
-            "profit", "is_win", "rsi", "trend"
-        ]
-        
         try:
             # Read existing content
             existing_content = []
@@ -1632,9 +1868,9 @@ class TradingManager:
                     header = next(reader, None)
                     
                     # Skip existing header if different
-                    if header != expected_header:
+                    if header is None or tuple(header) != EXPECTED_JOURNAL_HEADER:
                         # Check if header looks like data (not header)
-                        if header and len(header) == len(expected_header):
+                        if header and len(header) == len(EXPECTED_JOURNAL_HEADER):
                             try:
                                 # Try to parse first field as timestamp
                                 datetime.strptime(header[0], "%Y-%m-%d %H:%M:%S")
@@ -1648,8 +1884,10 @@ class TradingManager:
             # Write with correct header
             with open(filepath, 'w', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
-                writer.writerow(expected_header)
+                writer.writerow(EXPECTED_JOURNAL_HEADER)
                 writer.writerows(existing_content)
+            
+            self._journal_record_count[filepath] = len(existing_content)
                 
             logger.info(f"✅ CSV header repaired: {filepath}")
         except Exception as e:
@@ -1659,17 +1897,19 @@ class TradingManager:
         """
         Backup CSV file sebelum write jika >100 records.
         Task 9: CSV validation.
+        
+        Jumlah record diambil dari cache _journal_record_count (tanpa scan ulang file),
+        dan backup hanya dibuat sekali per kelipatan max_records.
         """
         if not os.path.exists(filepath):
             return
             
         try:
-            with open(filepath, 'r', newline='', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                next(reader, None)  # Skip header
-                record_count = sum(1 for _ in reader)
+            record_count = self._journal_record_count.get(filepath, 0)
+            backup_level = record_count // max_records
             
-            if record_count >= max_records:
+            if backup_level > 0 and self._journal_backup_level.get(filepath) != backup_level:
+                self._journal_backup_level[filepath] = backup_level
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 backup_path = filepath.replace('.csv', f'_backup_{timestamp}.csv')
                 shutil.copy2(filepath, backup_path)
@@ -1681,117 +1921,221 @@ class TradingManager:
         """
         Log trade ke CSV journal untuk analisis.
         
+        Row dibuat di sini (RSI/trend saat trade selesai), penulisan file
+        dikerjakan thread writer lewat _journal_queue. Lihat _write_journal_rows().
+        """
+        try:
+            journal_file = os.path.join(LOGS_DIR, f"trades_{datetime.now().strftime('%Y%m%d')}.csv")
+            
+            row = [
+                trade.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
+                trade.trade_number,
+                self.symbol,
+                trade.contract_type,
+                trade.entry_price,
+                trade.exit_price,
+                trade.stake,
+                trade.payout,
+                trade.profit,
+                "WIN" if trade.is_win else "LOSS",
+                self.strategy.current_rsi,
+                self.strategy.current_trend
+            ]
+            
+            if self._journal_thread is None or not self._journal_thread.is_alive():
+                self._journal_thread = threading.Thread(
+                    target=self._journal_writer_loop,
+                    name="journal-writer",
+                    daemon=True
+                )
+                self._journal_thread.start()
+            
+            self._journal_queue.put((journal_file, row))
+                        
+        except Exception as e:
+            logger.error(f"Failed to log trade to journal: {e}")
+            self._log_error(f"Journal write failed: {e}")
+    
+    def _journal_writer_loop(self):
+        """Thread writer: kumpulkan row journal lalu tulis satu batch per file"""
+        journal_queue = self._journal_queue
+        while True:
+            batch = [journal_queue.get()]
+            # Tunggu row berikutnya sampai batch penuh atau JOURNAL_FLUSH_SECS lewat,
+            # supaya beberapa trade berdekatan cukup satu write + fsync
+            deadline = monotonic() + self.JOURNAL_FLUSH_SECS
+            while batch[-1] is not None and len(batch) < self.JOURNAL_BATCH_SIZE:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(journal_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            rows_by_file: Dict[str, List[list]] = {}
+            for item in batch:
+                if item is not None:
+                    journal_file, row = item
+                    rows_by_file.setdefault(journal_file, []).append(row)
+            
+            for journal_file, rows in rows_by_file.items():
+                self._write_journal_rows(journal_file, rows)
+            
+            for _ in batch:
+                journal_queue.task_done()
+    
+    def _flush_journal(self):
+        """Tulis segera batch journal yang tertunda dan tunggu sampai selesai di disk"""
+        if self._journal_thread is not None and self._journal_thread.is_alive():
+            self._journal_queue.put(None)
+            self._journal_queue.join()
+    
+    def flush_pending_writes(self) -> None:
+        """
+        Tulis semua data yang masih antri di thread writer (journal CSV, session
+        recovery/summary) sebelum proses exit.
+        
+        Dipanggil dari shutdown handler di semua jalur: stop() bisa return lebih
+        awal (contract masih pending) sehingga _finalize_stop() belum flush.
+        """
+        self._flush_journal()
+        self._flush_io()
+    
+    def _truncate_partial_journal_line(self, filepath: str):
+        """
+        Potong baris terakhir yang tidak lengkap (tanpa newline), misalnya karena
+        crash di tengah append. Hanya membaca ekor file, bukan seluruh isinya.
+        """
+        try:
+            with open(filepath, "rb+") as f:
+                size = f.seek(0, os.SEEK_END)
+                if size == 0:
+                    return
+                f.seek(size - 1)
+                if f.read(1) == b"\n":
+                    return
+                
+                # Cari newline terakhir dari belakang, per blok
+                pos = size
+                keep = 0
+                while pos > 0:
+                    step = min(4096, pos)
+                    pos -= step
+                    f.seek(pos)
+                    idx = f.read(step).rfind(b"\n")
+                    if idx != -1:
+                        keep = pos + idx + 1
+                        break
+                
+                f.truncate(keep)
+            logger.warning(f"⚠️ Partial journal line removed: {filepath} ({size - keep} bytes)")
+        except Exception as e:
+            logger.error(f"Journal tail check failed: {e}")
+    
+    def _write_journal_rows(self, journal_file: str, rows: List[list]):
+        """
+        Tulis row trade ke CSV journal.
+        
         Enhancement v2.1 (Task 9):
         - Validate CSV file integrity sebelum append
         - Backup file sebelum write jika >100 records
-        - Use atomic write dengan temp file + rename
+        - Append langsung + fsync (CSV aman per baris; baris terakhir yang
+          terpotong dibuang saat file pertama kali dibuka, lihat
+          _truncate_partial_journal_line)
         - Auto-repair header jika missing
         """
         try:
-            journal_file = os.path.join(LOGS_DIR, f"trades_{datetime.now().strftime('%Y%m%d')}.csv")
             file_exists = os.path.exists(journal_file)
             
-            # Task 9: Validate CSV integrity
-            if file_exists and not self._validate_csv_integrity(journal_file):
-                logger.warning("⚠️ CSV integrity check failed, attempting repair...")
-                self._repair_csv_header(journal_file)
+            if journal_file not in self._journal_validated or not file_exists:
+                # File baru (rotasi harian) atau hilang: cache file lama tidak dipakai lagi
+                self._journal_record_count.clear()
+                self._journal_validated.clear()
+                self._journal_backup_level.clear()
+                
+                # Task 9: Validate CSV integrity (sekali per file, hasil di-cache)
+                if file_exists:
+                    self._truncate_partial_journal_line(journal_file)
+                    if not self._validate_csv_integrity(journal_file):
+                        logger.warning("⚠️ CSV integrity check failed, attempting repair...")
+                        self._repair_csv_header(journal_file)
+                self._journal_validated.add(journal_file)
             
             # Task 9: Backup if needed
             if file_exists:
                 self._backup_csv_if_needed(journal_file)
             
-            # Get current RSI and trend
-            stats = self.strategy.get_stats()
-            
-            # Task 9: Atomic write dengan temp file + rename
-            temp_file = None
-            try:
-                # Create temp file in same directory
-                fd, temp_file = tempfile.mkstemp(suffix='.csv', dir=LOGS_DIR)
-                os.close(fd)
-                
-                # Copy existing content to temp file
-                if file_exists:
-                    shutil.copy2(journal_file, temp_file)
-                
-                # Append new trade to temp file
-                with open(temp_file, "a", newline="", encoding="utf-8") as f:
-                    writer = csv.writer(f)
-                    
-                    # Write header jika file baru
-                    if not file_exists:
-                        writer.writerow([
-                            "timestamp", "trade_number", "symbol", "type", 
-                            "entry_price", "exit_price", "stake", "payout", 
-                            "profit", "is_win", "rsi", "trend"
-                        ])
-                    
-                    # Write trade data
-                    writer.writerow([
-                        trade.timestamp.strftime("%Y-%m-%d %H:%M:%S"),
-                        trade.trade_number,
-                        self.symbol,
-                        trade.contract_type,
-                        trade.entry_price,
-                        trade.exit_price,
-                        trade.stake,
-                        trade.payout,
-                        trade.profit,
-                        "WIN" if trade.is_win else "LOSS",
-                        stats.get("rsi", 0),
-                        stats.get("trend", "N/A")
-                    ])
-                    
-                    # Flush to OS buffer
-                    f.flush()
-                    # Ensure data hits disk before rename
-                    os.fsync(f.fileno())
+            with open(journal_file, "a", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
                 
-                # Atomic rename
-                shutil.move(temp_file, journal_file)
-                temp_file = None  # Mark as successfully moved
+                # Write header jika file baru
+                if not file_exists:
+                    writer.writerow(EXPECTED_JOURNAL_HEADER)
                 
-                logger.info(f"📝 Trade logged to journal (atomic): {journal_file}")
+                # Write trade data
+                writer.writerows(rows)
                 
-            finally:
-                # Cleanup temp file jika masih ada (gagal rename)
-                if temp_file and os.path.exists(temp_file):
-                    try:
-                        os.remove(temp_file)
-                    except:
-                        pass
+                # Flush to OS buffer
+                f.flush()
+                # Ensure data hits disk
+                os.fsync(f.fileno())
+            
+            self._journal_record_count[journal_file] = (
+                self._journal_record_count.get(journal_file, 0) + len(rows)
+            )
+            
+            logger.info(f"📝 {len(rows)} trade(s) logged to journal: {journal_file}")
                         
         except Exception as e:
             logger.error(f"Failed to log trade to journal: {e}")
             self._log_error(f"Journal write failed: {e}")
     
     def _save_session_summary(self):
-        """Simpan ringkasan session ke file"""
+        """
+        Simpan ringkasan session ke file.
+        
+        Isi file dirangkai di sini (stats saat ini), penulisan ke disk
+        dikerjakan thread IO lewat _write_session_summary().
+        """
         try:
-            summary_file = os.path.join(LOGS_DIR, f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+            now = datetime.now()
+            summary_file = os.path.join(LOGS_DIR, f"session_{now.strftime('%Y%m%d_%H%M%S')}.txt")
+            stats = self.stats
+            
+            content = (
+                "=" * 50 + "\n"
+                "SESSION SUMMARY\n"
+                + "=" * 50 + "\n\n"
+                f"Timestamp: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+                f"Symbol: {self.symbol}\n"
+                f"Base Stake: ${self.base_stake}\n\n"
+                "STATISTICS:\n"
+                f"  Total Trades: {stats.total_trades}\n"
+                f"  Wins: {stats.wins}\n"
+                f"  Losses: {stats.losses}\n"
+                f"  Win Rate: {stats.win_rate:.1f}%\n\n"
+                "BALANCE:\n"
+                f"  Starting: ${stats.starting_balance:.2f}\n"
+                f"  Ending: ${stats.current_balance:.2f}\n"
+                f"  Highest: ${stats.highest_balance:.2f}\n"
+                f"  Lowest: ${stats.lowest_balance:.2f}\n"
+                f"  Net P/L: ${stats.total_profit:+.2f}\n\n"
+                "RISK METRICS:\n"
+                f"  Max Consecutive Losses: {self.consecutive_losses}\n"
+                f"  Daily Loss: ${self.daily_loss:.2f}\n"
+                + "=" * 50 + "\n"
+            )
             
+            self._submit_io(self._write_session_summary, summary_file, content)
+        except Exception as e:
+            logger.error(f"Failed to save session summary: {e}")
+    
+    def _write_session_summary(self, summary_file: str, content: str):
+        """Tulis ringkasan session yang sudah dirangkai ke file"""
+        try:
             with open(summary_file, "w", encoding="utf-8") as f:
-                f.write("=" * 50 + "\n")
-                f.write("SESSION SUMMARY\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"Symbol: {self.symbol}\n")
-                f.write(f"Base Stake: ${self.base_stake}\n\n")
-                f.write("STATISTICS:\n")
-                f.write(f"  Total Trades: {self.stats.total_trades}\n")
-                f.write(f"  Wins: {self.stats.wins}\n")
-                f.write(f"  Losses: {self.stats.losses}\n")
-                f.write(f"  Win Rate: {self.stats.win_rate:.1f}%\n\n")
-                f.write("BALANCE:\n")
-                f.write(f"  Starting: ${self.stats.starting_balance:.2f}\n")
-                f.write(f"  Ending: ${self.stats.current_balance:.2f}\n")
-                f.write(f"  Highest: ${self.stats.highest_balance:.2f}\n")
-                f.write(f"  Lowest: ${self.stats.lowest_balance:.2f}\n")
-                f.write(f"  Net P/L: ${self.stats.total_profit:+.2f}\n\n")
-                f.write("RISK METRICS:\n")
-                f.write(f"  Max Consecutive Losses: {self.consecutive_losses}\n")
-                f.write(f"  Daily Loss: ${self.daily_loss:.2f}\n")
-                f.write("=" * 50 + "\n")
+                f.write(content)
                 
             logger.info(f"📊 Session summary saved to: {summary_file}")
         except Exception as e:
@@ -2022,7 +2366,7 @@ class TradingManager:
                 terminal_signal = self.terminal_strategy.get_signal_for_trading()
                 stats = self.terminal_strategy.get_stats()
                 tick_count = stats.get('tick_count', 0)
-                last_price = list(self.terminal_strategy.tick_history)[-1] if self.terminal_strategy.tick_history else 0.0
+                last_price = self.terminal_strategy.tick_history[-1] if self.terminal_strategy.tick_history else 0.0
                 
                 # Build terminal_data for dashboard
                 terminal_data = {
@@ -2201,7 +2545,7 @@ class TradingManager:
                 terminal_signal = self.terminal_strategy.get_signal_for_trading()
                 stats = self.terminal_strategy.get_stats()
                 tick_count = stats.get('tick_count', 0)
-                last_price = list(self.terminal_strategy.tick_history)[-1] if self.terminal_strategy.tick_history else 0.0
+                last_price = self.terminal_strategy.tick_history[-1] if self.terminal_strategy.tick_history else 0.0
                 
                 # Calculate sniper session stats
                 total_trades = self.stats.total_trades
@@ -2261,8 +2605,6 @@ class TradingManager:
         
         Enhanced: Now supports multiple strategy modes (Multi-Indicator, LDP, Tick Analyzer)
         """
-        import time as time_module
-        
         # ANTI-DOUBLE BUY: Double check state dan processing flag
         if self.state != TradingState.RUNNING:
             return
@@ -2324,7 +2666,7 @@ class TradingManager:
                     multi_indicator_data=multi_indicator_data
                 )
                 get_event_bus().publish("signal", signal_event)
-                logger.debug(f"📡 WAIT signal published: strategy={strategy_mode_name}, confidence={confidence:.2f}")
+                logger.debug("📡 WAIT signal published: strategy=%s, confidence=%.2f", strategy_mode_name, confidence)
                 return
             
             # Apply entry filter check before executing any trade
@@ -2375,15 +2717,16 @@ class TradingManager:
                         multi_indicator_data=multi_indicator_data
                     )
                     get_event_bus().publish("signal", signal_event)
-                    logger.debug(f"📡 FILTERED signal published: strategy={strategy_mode_name}, confidence={confidence:.2f}")
+                    logger.debug("📡 FILTERED signal published: strategy=%s, confidence=%.2f", strategy_mode_name, confidence)
                     return
-                else:
+                elif logger.isEnabledFor(logging.DEBUG):
+                    # get_filter_stats() hanya dibutuhkan untuk pesan debug ini
                     filter_stats = self.entry_filter.get_filter_stats()
-                    logger.debug(f"✅ Entry Filter ALLOWED: conf={confidence:.2f}, allowed_count={filter_stats.get('allowed_entries', 0)}")
+                    logger.debug("✅ Entry Filter ALLOWED: conf=%.2f, allowed_count=%s", confidence, filter_stats.get('allowed_entries', 0))
                 
             # Ada signal! Set flag processing SEBELUM eksekusi (inside lock)
             self.is_processing_signal = True
-            self.signal_processing_start_time = time_module.time()
+            self.signal_processing_start_time = monotonic()
             
             contract_type = signal.value  # "CALL" atau "PUT"
             
@@ -2609,8 +2952,6 @@ class TradingManager:
         Args:
             contract_type: "CALL" atau "PUT"
         """
-        import time as time_module
-        
         # Check circuit breaker terlebih dahulu
         if self._check_circuit_breaker():
             self.state = TradingState.RUNNING
@@ -2639,7 +2980,7 @@ class TradingManager:
         if not is_safe:
             logger.error(f"🛑 Pre-flight risk check failed: {risk_msg}")
             if self.on_error:
-                self.on_error(f"Trading dihentikan! {risk_msg}")
+                self._notify(self.on_error, f"Trading dihentikan! {risk_msg}")
             self.is_processing_signal = False
             self.signal_processing_start_time = 0.0
             self._complete_session()
@@ -2648,7 +2989,7 @@ class TradingManager:
         # RISK CHECK 1: Cek balance cukup
         if self.current_stake > current_balance:
             if self.on_error:
-                self.on_error(f"Balance tidak cukup! Stake: ${self.current_stake}, Balance: ${current_balance:.2f}")
+                self._notify(self.on_error, f"Balance tidak cukup! Stake: ${self.current_stake}, Balance: ${current_balance:.2f}")
             self.state = TradingState.STOPPED
             self.is_processing_signal = False
             return
@@ -2664,7 +3005,7 @@ class TradingManager:
         if self.daily_loss >= self.MAX_DAILY_LOSS and not is_demo_account:
             logger.warning(f"⚠️ Daily loss limit reached! Daily loss: ${self.daily_loss:.2f} >= ${self.MAX_DAILY_LOSS:.2f}")
             if self.on_error:
-                self.on_error(f"Trading dihentikan! Daily loss limit ${self.MAX_DAILY_LOSS:.2f} tercapai. Loss hari ini: ${self.daily_loss:.2f}")
+                self._notify(self.on_error, f"Trading dihentikan! Daily loss limit ${self.MAX_DAILY_LOSS:.2f} tercapai. Loss hari ini: ${self.daily_loss:.2f}")
             self.is_processing_signal = False
             self.signal_processing_start_time = 0.0
             self._complete_session()
@@ -2679,7 +3020,7 @@ class TradingManager:
             logger.warning(f"⚠️ Balance mungkin tidak cukup untuk Martingale! Next stake: ${projected_next_stake:.2f}, Balance: ${current_balance:.2f}")
         
         # Record buy request time untuk timeout tracking (Task 1)
-        self.buy_request_time = time_module.time()
+        self.buy_request_time = monotonic()
         
         # Eksekusi buy
         success = self.ws.buy_contract(
@@ -2810,6 +3151,7 @@ class TradingManager:
         self.last_progress_notification_time = 0.0
         self.last_notified_milestone = -1
         self.sent_milestones.clear()  # Reset sent milestones for new session
+        self._progress_done = False
         
         # Reset risk management counters for new session
         if not session_restored:
@@ -2818,6 +3160,7 @@ class TradingManager:
         self.signal_processing_start_time = 0.0
         self.last_trade_time = 0.0
         self.buy_retry_count = 0
+        self.buy_retry_until = 0.0
         
         # Reset daily loss jika tanggal berbeda
         today = datetime.now().strftime("%Y-%m-%d")
@@ -2931,8 +3274,11 @@ class TradingManager:
         summary = self._generate_session_summary()
         self.last_session_summary = summary  # Store for later retrieval if needed
         
-        # === STEP 2: Save session summary to file ===
+        # === STEP 2: Flush journal writer, lalu save session summary to file ===
+        # (harus sebelum cleanup supaya writer tidak membuat ulang trades_*.csv)
+        self._flush_journal()
         self._save_session_summary()
+        self._flush_io()
         
         # === STEP 3: Cleanup old log files ===
         self._cleanup_session_logs()
@@ -2954,7 +3300,7 @@ class TradingManager:
         
         # Reset session stats
         self.stats = SessionStats()
-        self.trade_history = []
+        self.trade_history.clear()
         self.analytics = SessionAnalytics()
         
         # Reset progress tracking
@@ -2962,14 +3308,16 @@ class TradingManager:
         self.last_progress_notification_time = 0.0
         self.last_notified_milestone = -1
         self.sent_milestones = set()
+        self._progress_done = False
         
         # Reset daily loss tracking
         self.daily_loss = 0.0
         
         # Reset buy tracking
         self.buy_retry_count = 0
+        self.buy_retry_until = 0.0
         self.buy_request_time = 0.0
-        self.buy_failure_times = []
+        self.buy_failure_times.clear()
         self.circuit_breaker_active = False
         
         # Reset contract tracking